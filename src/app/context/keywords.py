@@ -5,6 +5,8 @@ Provides the :class:`Keywords` helper that identifies trigger characters
 whether autocomplete should remain open after a completion is accepted.
 """
 
+import sys
+
 
 class Keywords:
     """Manages trigger characters used to activate autocomplete providers.
@@ -23,6 +25,8 @@ class Keywords:
 
     CONTINUE_WRITE_VALID_CHARS = ("/", ":", "#", "@", ".")
 
+    _CONTINUE_CHARS = frozenset(CONTINUE_WRITE_VALID_CHARS)
+
     VALID_TRIGGER_PREFIXES = {" ", "\t", "\n", "(", "[", "{", "<"}
 
     def __init__(self, triggers):
@@ -33,7 +37,9 @@ class Keywords:
                 longest-first so multi-character triggers match before
                 single-character ones.
         """
-        self._triggers = triggers
+        # Interned so the matched trigger hashes and compares by identity
+        # when used as a key into the providers mapping.
+        self._triggers = [sys.intern(t) for t in triggers]
 
     def must_continue(self, txt):
         """Return ``True`` if *txt* ends with a character that should keep
@@ -46,7 +52,8 @@ class Keywords:
             ``True`` when the last character is in
             :attr:`CONTINUE_WRITE_VALID_CHARS`.
         """
-        return str(txt).endswith(self.CONTINUE_WRITE_VALID_CHARS)
+        txt = str(txt)
+        return bool(txt) and txt[-1] in self._CONTINUE_CHARS
 
     def find_last_trigger(self, before: str) -> tuple[int, int, str | None]:
         """Find the rightmost valid trigger in *before*.
@@ -30,7 +30,7 @@ def _new_session_id() -> str:
 #    description: str
 #    callback: Callable[[], Any]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageKind:
     actor: str
     msg: str
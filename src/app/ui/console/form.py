@@ -6,20 +6,39 @@ with incremental cross-field validation.  The user can navigate backwards
 with Escape and cancel the form entirely from the first field.
 """
 
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Callable, Dict, List, Tuple
 from prompt_toolkit import prompt
 from prompt_toolkit.key_binding import KeyBindings
-from jsonschema import (
-    validate,
-    Draft202012Validator,
-    ValidationError as JsonSchemaError,
-)
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 
 
 class _EscapePressed(Exception):
     """Sentinel exception raised when the user presses Escape during input."""
 
 
+_TRUE = frozenset(("true", "yes", "y", "1"))
+_FALSE = frozenset(("false", "no", "n", "0"))
+
+
+def _cast_bool(raw: str) -> bool:
+    lowered = raw.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError("Expected boolean (yes/no, true/false)")
+
+
+_CASTERS: Dict[str, Callable[[str], Any]] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": _cast_bool,
+}
+
+
 class ConsoleFormRenderer:
     """Interactive terminal form renderer backed by JSON Schema.
 
@@ -34,6 +53,17 @@ class ConsoleFormRenderer:
     def __init__(self) -> None:
         self.schema: Dict[str, Any] | None = None
         self.field_order: List[str] = []
+        # Position of each name in field_order, rebuilt when it is replaced.
+        self._field_pos_order: List[str] | None = None
+        self._field_pos: Dict[str, int] = {}
+        # Compiled validators for self.schema: the full form and the one
+        # visible up to each field index.  Reset when the schema changes.
+        self._validators_schema: Dict[str, Any] | None = None
+        self._form_validator: Draft202012Validator | None = None
+        self._step_validators: Dict[int, Draft202012Validator] = {}
+        # id(items schema) -> (items schema, validator); the schema is kept
+        # so a reused id is never mistaken for a cached entry.
+        self._item_validators: Dict[int, Tuple[Dict[str, Any], Draft202012Validator]] = {}
         self._kb = KeyBindings()
 
         @self._kb.add("escape")
@@ -119,11 +149,10 @@ class ConsoleFormRenderer:
             return None
 
         # Validación final completa
-        try:
-            validate(instance=data, schema=json_schema)
-        except JsonSchemaError as e:
-            print("\n❌ Final validation error:", e.message)
-            raise
+        error = best_match(self._full_validator().iter_errors(data))
+        if error is not None:
+            print("\n❌ Final validation error:", error.message)
+            raise error
 
         return data
 
@@ -154,18 +183,53 @@ class ConsoleFormRenderer:
 
         assert self.schema is not None
 
+        idx = self._field_index(field_name)
+        instance = dict(partial_data)
+        instance[field_name] = candidate_value
+
+        validator = self._step_validator(idx)
+        return [e.message for e in validator.iter_errors(instance)]
+
+    def _field_index(self, field_name: str) -> int:
+        """Return the position of *field_name* in :attr:`field_order`."""
+        if self._field_pos_order is not self.field_order:
+            self._field_pos_order = self.field_order
+            self._field_pos = {name: i for i, name in enumerate(self.field_order)}
+        return self._field_pos[field_name]
+
+    def _reset_validators(self) -> None:
+        """Drop compiled validators built for a previous schema."""
+        if self._validators_schema is not self.schema:
+            self._validators_schema = self.schema
+            self._form_validator = None
+            self._step_validators.clear()
+
+    def _full_validator(self) -> Draft202012Validator:
+        """Return the validator for the whole form, checking the schema once."""
+        self._reset_validators()
+        if self._form_validator is None:
+            assert self.schema is not None
+            Draft202012Validator.check_schema(self.schema)
+            self._form_validator = Draft202012Validator(self.schema)
+        return self._form_validator
+
+    def _step_validator(self, idx: int) -> Draft202012Validator:
+        """Return the validator for the fields up to *idx*, built once."""
+        self._reset_validators()
+        validator = self._step_validators.get(idx)
+        if validator is not None:
+            return validator
+
+        assert self.schema is not None
         properties = self.schema.get("properties", {})
         required = set(self.schema.get("required", []))
-
-        idx = self.field_order.index(field_name)
-        visible_fields = set(self.field_order[: idx + 1])
+        # Only the visible prefix is walked, not every property.
+        visible_fields = [k for k in islice(self.field_order, idx + 1) if k in properties]
 
         subschema: Dict[str, Any] = {
             "type": "object",
-            "properties": {
-                k: v for k, v in properties.items() if k in visible_fields
-            },
-            "required": [k for k in required if k in visible_fields],
+            "properties": {k: properties[k] for k in visible_fields},
+            "required": [k for k in visible_fields if k in required],
         }
 
         # Copiamos keywords de validación cruzada
@@ -173,13 +237,9 @@ class ConsoleFormRenderer:
             if keyword in self.schema:
                 subschema[keyword] = self.schema[keyword]
 
-        instance = dict(partial_data)
-        instance[field_name] = candidate_value
-
         validator = Draft202012Validator(subschema)
-        errors = list(validator.iter_errors(instance))
-
-        return [e.message for e in errors]
+        self._step_validators[idx] = validator
+        return validator
 
     # ============================================================
     # INPUT HANDLING
@@ -397,6 +457,9 @@ class ConsoleFormRenderer:
 
         # Free array
         values = []
+        # Items are cast scalars, always hashable: duplicates are found by
+        # hash instead of scanning the list on every add.
+        seen = set()
         print("Add items one by one (Enter to finish):")
 
         while True:
@@ -418,7 +481,7 @@ class ConsoleFormRenderer:
                 continue
 
             # Unique check
-            if unique and value in values:
+            if unique and value in seen:
                 print("❌ Duplicate value not allowed")
                 continue
 
@@ -435,6 +498,7 @@ class ConsoleFormRenderer:
                 continue
 
             values.append(value)
+            seen.add(value)
 
             if max_items and len(values) >= max_items:
                 print(f"ℹ Reached maxItems={max_items}")
@@ -470,19 +534,10 @@ class ConsoleFormRenderer:
         Raises:
             ValueError: If the conversion fails or the type is unsupported.
         """
-        if field_type == "string":
-            return raw
-        if field_type == "integer":
-            return int(raw)
-        if field_type == "number":
-            return float(raw)
-        if field_type == "boolean":
-            if raw.lower() in ("true", "yes", "y", "1"):
-                return True
-            if raw.lower() in ("false", "no", "n", "0"):
-                return False
-            raise ValueError("Expected boolean (yes/no, true/false)")
-        raise ValueError(f"Unsupported field type: {field_type}")
+        caster = _CASTERS.get(field_type) if isinstance(field_type, str) else None
+        if caster is None:
+            raise ValueError(f"Unsupported field type: {field_type}")
+        return caster(raw)
 
     def _validate_array_item(self, item_value, item_schema) -> list[str]:
         """Validate a single array element against the ``items`` sub-schema.
@@ -494,9 +549,11 @@ class ConsoleFormRenderer:
         Returns:
             A list of error messages (empty on success).
         """
-        validator = Draft202012Validator(item_schema)
-        errors = list(validator.iter_errors(item_value))
-        return [e.message for e in errors]
+        cached = self._item_validators.get(id(item_schema))
+        if cached is None or cached[0] is not item_schema:
+            cached = (item_schema, Draft202012Validator(item_schema))
+            self._item_validators[id(item_schema)] = cached
+        return [e.message for e in cached[1].iter_errors(item_value)]
 
     def _validate_array_partial(
         self,
@@ -3,10 +3,10 @@
 :class:`AppConfigDialog` is a :class:`~.config_dialog.ConfigDialog` subclass
 that collects its pages and initial values from a list of
 :class:`~.config_provider.ConfigProvider` instances.  When the user clicks
-*Apply* or *Accept*, every provider's :meth:`~.config_provider.ConfigProvider.save_config`
-method is called with the full configuration dictionary before the normal
-dialog behaviour (posting :class:`~.config_dialog.ConfigDialog.Applied` or
-dismissing).
+*Apply* or *Accept*, the :meth:`~.config_provider.ConfigProvider.save_config`
+method of every provider whose page values changed is called with the full
+configuration dictionary before the normal dialog behaviour (posting
+:class:`~.config_dialog.ConfigDialog.Applied` or dismissing).
 """
 
 from __future__ import annotations
@@ -14,9 +14,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Sequence
 
-from textual.containers import VerticalScroll
-from textual.widgets import Static, Tree
-
 from app.ui.textual.widgets.config_dialog import ConfigPage, ConfigDialog, ConfigValues
 from app.ui.textual.widgets.report import Report
 
@@ -45,7 +42,8 @@ class ConfigProvider(ABC):
         """Persist configuration changes.
 
         Called with the *entire* configuration dictionary (all providers'
-        pages) when the user clicks Apply or Accept.
+        pages) when the user clicks Apply or Accept and this provider's
+        page values differ from the last loaded or saved ones.
 
         Args:
             values: Mapping of page id to :class:`ConfigValues`.
@@ -57,9 +55,9 @@ class AppConfigDialog(ConfigDialog):
 
     Each provider contributes one top-level page (which may have children).
     Initial values are collected via
-    :meth:`~ConfigProvider.config_values` and on Apply/Accept every
-    provider's :meth:`~ConfigProvider.save_config` is invoked with the
-    complete values dictionary.
+    :meth:`~ConfigProvider.config_values` and on Apply/Accept the
+    :meth:`~ConfigProvider.save_config` of every provider whose page values
+    changed is invoked with the complete values dictionary.
 
     Args:
         providers: List of configuration providers.
@@ -73,9 +71,11 @@ class AppConfigDialog(ConfigDialog):
     ) -> None:
         self._providers = list(providers)
         pages = [p.config_page() for p in self._providers]
+        # Page id contributed by each provider, in provider order.
+        self._provider_ids: List[str] = [page.id for page in pages]
         initial: Dict[str, ConfigValues] = {
-            p.config_page().id: p.config_values()
-            for p in self._providers
+            pid: p.config_values()
+            for pid, p in zip(self._provider_ids, self._providers)
         }
         super().__init__(pages, initial_values=initial, title=title)
 
@@ -84,9 +84,17 @@ class AppConfigDialog(ConfigDialog):
     # ------------------------------------------------------------------
 
     def _notify_providers(self, values: Dict[str, ConfigValues]) -> None:
-        """Call :meth:`save_config` on every provider."""
-        for provider in self._providers:
+        """Call :meth:`save_config` on every provider whose values changed.
+
+        Values are compared against the provider's initial values, which
+        are updated after each successful save.
+        """
+        for pid, provider in zip(self._provider_ids, self._providers):
+            current = values.get(pid)
+            if current == self._initial_values.get(pid):
+                continue
             provider.save_config(values)
+            self._initial_values[pid] = current
 
     # ------------------------------------------------------------------
     # Page reload
@@ -98,32 +106,46 @@ class AppConfigDialog(ConfigDialog):
         Called after *Apply* so that pages whose schemas or values depend
         on the just-saved configuration are refreshed (e.g. topic selection
         lists that depend on the global topic definitions).
+
+        The tree and the page forms act as a render cache: the tree is only
+        rebuilt when the page hierarchy changed, and a cached form (shown
+        or hidden) is only dropped when its page schema or stored values
+        changed.
         """
         current_id = self._current_page.id if self._current_page else None
-
-        # Clear form area first — await ensures old widgets are fully removed
-        # before new ones with the same IDs are mounted.
-        container = self.query_one("#config-form-area", VerticalScroll)
-        await container.remove_children()
+        old_pages = self._pages
+        old_index = dict(self._page_index)
+        old_values = dict(self._page_values)
 
         # Re-collect pages and values from providers
-        self._pages = [p.config_page() for p in self._providers]
+        pages = [p.config_page() for p in self._providers]
+        pages_changed = pages != old_pages
+        if not pages_changed:
+            # Keep the page objects referenced by the existing tree nodes.
+            pages = old_pages
+        self._pages = pages
+        self._provider_ids = [page.id for page in self._pages]
         self._initial_values = {
             page.id: provider.config_values()
             for page, provider in zip(self._pages, self._providers)
         }
 
         # Rebuild internal indexes
-        self._page_index.clear()
-        self._parent_map.clear()
         self._page_values.clear()
-        self._index_pages(self._pages, None)
+        self._index_pages()
         self._load_initial_values()
 
         # Rebuild tree
-        tree = self.query_one("#config-tree", Tree)
-        tree.clear()
-        self._build_tree()
+        if pages_changed:
+            # Keep compiled validators of pages whose schema is unchanged.
+            self._page_validators = {
+                pid: validator
+                for pid, validator in self._page_validators.items()
+                if pid in self._page_index
+                and self._page_index[pid].schema == old_index[pid].schema
+            }
+            self._tree.clear()
+            self._build_tree()
 
         # Re-render current page (or first page if no longer exists)
         if current_id and current_id in self._page_index:
@@ -133,8 +155,25 @@ class AppConfigDialog(ConfigDialog):
         else:
             self._current_page = None
 
-        if self._current_page:
-            self._render_page_form(self._current_page)
+        # Drop cached forms whose page schema or stored values changed —
+        # await ensures they are fully removed before replacements with the
+        # same IDs are mounted.
+        stale = [
+            self._forms.pop(pid)
+            for pid in list(self._forms)
+            if pid not in self._page_index
+            or self._page_index[pid].schema != old_index[pid].schema
+            or self._page_values.get(pid) != old_values.get(pid)
+        ]
+        if stale:
+            await self._form_container.remove_children(stale)
+        if self._form in stale:
+            self._form = None
+
+        page = self._current_page
+        if page is None or (self._form is not None and page.id == current_id):
+            return
+        self._render_page_form(page)
 
     # ------------------------------------------------------------------
     # Override apply / accept to notify providers
@@ -143,12 +182,10 @@ class AppConfigDialog(ConfigDialog):
     def _apply(self) -> None:
         errors = self._validate_all()
         if errors:
-            self.query_one("#config-errors", Static).update(
-                "\n".join(f"* {e}" for e in errors)
-            )
+            self._set_error("\n".join(f"* {e}" for e in errors))
             return
-        self.query_one("#config-errors", Static).update("")
-        values = self._collect_all_values()
+        self._set_error("")
+        values = self._build_values()
         try:
             self._notify_providers(values)
         except Exception as exc:
@@ -169,11 +206,9 @@ class AppConfigDialog(ConfigDialog):
     def _accept(self) -> None:
         errors = self._validate_all()
         if errors:
-            self.query_one("#config-errors", Static).update(
-                "\n".join(f"* {e}" for e in errors)
-            )
+            self._set_error("\n".join(f"* {e}" for e in errors))
             return
-        values = self._collect_all_values()
+        values = self._build_values()
         try:
             self._notify_providers(values)
         except Exception as exc:
@@ -9,14 +9,17 @@ mapped to a :data:`CompletionProvider` callable that returns matching
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 from textual.widget import Widget
 from textual.widgets import Input
 from textual.reactive import reactive
 from textual.events import Key
 from textual.message import Message
+from textual.worker import get_current_worker
 
 from textual_autocomplete import AutoComplete, DropdownItem
 from textual_autocomplete._autocomplete import TargetState
@@ -32,8 +35,9 @@ class ChatInput(Widget):
     """Composite widget providing a text input with trigger-based autocomplete.
 
     When the user types a trigger character (after whitespace or at the start
-    of the line), the corresponding :data:`CompletionProvider` is invoked and
-    matching suggestions appear in a dropdown.
+    of the line), the corresponding :data:`CompletionProvider` is invoked in
+    a worker thread and matching suggestions appear in a dropdown once it
+    returns.
 
     Args:
         keywords: :class:`~app.context.keywords.Keywords` instance managing
@@ -74,9 +78,14 @@ class ChatInput(Widget):
             id: Optional widget DOM id.
         """
         super().__init__(id=id)
-        self.triggers = triggers
+        self.triggers = {sys.intern(k): v for k, v in triggers.items()}
         self.keywords = keywords
         self.placeholder = placeholder
+        # Last provider result and the (trigger, prefix) it was fetched for.
+        self._items_key: Optional[Tuple[str, str]] = None
+        self._items: List[DropdownItem] = []
+        # (trigger, prefix) currently being fetched by a worker.
+        self._pending_key: Optional[Tuple[str, str]] = None
 
     # ─────────────────────────────────────
     # UI
@@ -109,9 +118,11 @@ class ChatInput(Widget):
     def _candidates(self, state: TargetState) -> List[DropdownItem]:
         """Return autocomplete suggestions for the current input state.
 
-        Locates the last trigger in the text before the cursor, invokes the
-        corresponding provider with the token typed after the trigger, and
-        returns the filtered items.
+        Locates the last trigger in the text before the cursor and returns
+        the items last fetched for that token.  When the token changed, the
+        corresponding provider is run in a worker thread and the dropdown is
+        refreshed once it answers; meanwhile the previous snapshot for the
+        same trigger is served so typing never blocks on the provider.
 
         Args:
             state: Autocomplete target state with text and cursor position.
@@ -131,8 +142,6 @@ class ChatInput(Widget):
         if trigger_pos == -1 or trigger_char is None:
             return []
 
-        provider = self.triggers[trigger_char]
-
         # token entre trigger y cursor
         prefix = before[trigger_pos + trigger_len :]
 
@@ -140,16 +149,49 @@ class ChatInput(Widget):
         if any(ch.isspace() for ch in prefix):
             return []
 
-        raw_items = provider(prefix)
+        key = (trigger_char, prefix)
+        if key != self._items_key:
+            if key != self._pending_key:
+                self._pending_key = key
+                self.run_worker(
+                    partial(self._fetch_candidates, key, self.triggers[trigger_char]),
+                    group="chat-candidates",
+                    exclusive=True,
+                    thread=True,
+                )
+            if self._items_key is None or self._items_key[0] != trigger_char:
+                return []
+
+        return list(self._items)
+
+    def _fetch_candidates(
+        self, key: Tuple[str, str], provider: CompletionProvider
+    ) -> None:
+        """Run *provider* off the event loop and publish its items.
+
+        Args:
+            key: ``(trigger, prefix)`` pair the items are fetched for.
+            provider: Completion provider bound to the trigger.
+        """
+        items = provider(key[1])
+        if get_current_worker().is_cancelled:
+            return
+        self.app.call_from_thread(self._publish_candidates, key, items)
 
-        return [
-            DropdownItem(
-                # main=item.main + ("" if str(item.main).endswith( self.CONTINUE_WRITE_VALID_CHARS ) else " "),
-                main=item.main + ("" if self.keywords.must_continue(item.main) else " "),
-                prefix=item.prefix,
-            )
-            for item in raw_items
-        ]
+    def _publish_candidates(
+        self, key: Tuple[str, str], items: List[DropdownItem]
+    ) -> None:
+        """Store fetched *items* and refresh the dropdown.
+
+        Items for a key that was superseded while they were being fetched
+        are dropped: a newer fetch is on its way.
+        """
+        if self._pending_key is not None and key != self._pending_key:
+            return
+        self._pending_key = None
+        self._items_key = key
+        self._items = items
+        self._autocomplete.refresh_candidates()
 
     # ─────────────────────────────────────
     # Submit / Events
@@ -174,6 +216,8 @@ class ChatInput(Widget):
             value: The submitted text.
         """
 
+        __slots__ = ("value",)
+
         def __init__(self, value: str):
             super().__init__()
             self.value = value
\ No newline at end of file
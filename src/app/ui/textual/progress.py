@@ -150,13 +150,19 @@ class ProgressDialog(ModalScreen[None]):
         self._unsubscribe: Optional[Callable[[], None]] = None
 
     def compose(self):
+        # Kept as attributes: _refresh runs on every monitor update.
+        self._title_static = Static("Progress", id="progress-title")
+        self._message_static = Static("", id="progress-message")
+        self._progress_bar = ProgressBar(total=100, id="progress-bar")
+        self._summary_static = Static("", id="progress-summary")
+        self._close_button = Button("Close", id="progress-close", variant="primary")
         with Vertical(id="progress-dialog"):
-            yield Static("Progress", id="progress-title")
-            yield Static("", id="progress-message")
-            yield ProgressBar(total=100, id="progress-bar")
-            yield Static("", id="progress-summary")
+            yield self._title_static
+            yield self._message_static
+            yield self._progress_bar
+            yield self._summary_static
             with Horizontal(id="progress-buttons"):
-                yield Button("Close", id="progress-close", variant="primary")
+                yield self._close_button
 
     def on_mount(self) -> None:
         self._unsubscribe = self._monitor.subscribe(self._on_monitor_update)
@@ -168,7 +174,7 @@ class ProgressDialog(ModalScreen[None]):
             self._unsubscribe = None
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "progress-close":
+        if event.button is self._close_button:
             self.dismiss(None)
 
     def _on_monitor_update(self, monitor: UiProgressMonitor) -> None:
@@ -183,18 +189,14 @@ class ProgressDialog(ModalScreen[None]):
         title = self._monitor.title or "Progress"
         errors = self._monitor.error_count
 
-        self.query_one("#progress-title", Static).update(title)
-        self.query_one("#progress-message", Static).update(message)
-        bar = self.query_one("#progress-bar", ProgressBar)
+        self._title_static.update(title)
+        self._message_static.update(message)
+        bar = self._progress_bar
         bar.total = 100
         bar.progress = percent
-        self.query_one(
-            "#progress-summary",
-            Static,
-        ).update(f"{completed}/{total} ({percent:.1f}%)  Errors: {errors}")
+        self._summary_static.update(f"{completed}/{total} ({percent:.1f}%)  Errors: {errors}")
 
-        close = self.query_one("#progress-close", Button)
-        close.disabled = False
+        self._close_button.disabled = False
 
 
 class ProgressButton(Button):
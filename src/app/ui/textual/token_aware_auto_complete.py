@@ -9,7 +9,9 @@ positioned above the cursor to avoid overlapping with the chat area.
 from __future__ import annotations
 
 from typing import Mapping, Any, Iterable
+from textual import events
 from textual.geometry import Offset, Region, Spacing
+from textual.widgets import Input
 
 from textual_autocomplete import AutoComplete
 from textual_autocomplete.fuzzy_search import FuzzySearch
@@ -39,7 +41,10 @@ class TokenAwareAutoComplete(AutoComplete):
 
     Instead of replacing the entire input value on completion, this class
     locates the trigger character preceding the cursor and replaces only
-    the token between the trigger and the cursor position.
+    the token between the trigger and the cursor position.  A space is
+    inserted after the completed token unless
+    :meth:`~app.context.keywords.Keywords.must_continue` says the user is
+    expected to keep typing it.
 
     Args:
         keywords: :class:`~app.context.keywords.Keywords` instance for
@@ -60,6 +65,19 @@ class TokenAwareAutoComplete(AutoComplete):
         self._fuzzy_search = TokenFuzzySearch()
         self._keywords = keywords
         self._resolvers = resolvers
+        # Set when the user dismisses the dropdown with Escape, cleared by
+        # the next edit: late candidates must not reopen it meanwhile.
+        self._dismissed = False
+
+    def on_mount(self) -> None:
+        # AutoComplete's own on_mount also runs and subscribes its handler.
+        self.target.message_signal.subscribe(self, self._track_dismissal)
+
+    def _track_dismissal(self, event: events.Event) -> None:
+        if isinstance(event, events.Key) and event.key == "escape":
+            self._dismissed = True
+        elif isinstance(event, Input.Changed):
+            self._dismissed = False
 
     def apply_completion(self, item: DropdownItem, state: TargetState) -> None:
         """Replace only the active token with the selected completion item.
@@ -92,8 +110,9 @@ class TokenAwareAutoComplete(AutoComplete):
         suffix = self._suffix_for(trigger)
 
         # item.main es lo que mostramos y lo que insertamos como "valor"
-        
         replacement_token = item
+        if not self._keywords.must_continue(replacement_token):
+            replacement_token += " "
 
         # reemplaza [trigger ... cursor) por trigger + replacement_token + suffix
         new_text = (
@@ -110,6 +129,19 @@ class TokenAwareAutoComplete(AutoComplete):
         new_cursor = trigger_pos + trigger_len + len(replacement_token) + len(suffix)
         input_widget.cursor_position = new_cursor
 
+    def refresh_candidates(self) -> None:
+        """Re-query the candidates callable and update the dropdown.
+
+        Used when candidates become available asynchronously, after the
+        target change that requested them has already been handled.  Does
+        nothing once the target lost focus or the user dismissed the
+        dropdown, so a late answer never reopens it.
+        """
+        target = self.target
+        if not target.has_focus or (self._dismissed and not self.display):
+            return
+        self._handle_target_update()
+
     def _align_to_target(self) -> None:
         """Position the dropdown above the cursor, constrained to the screen.
 
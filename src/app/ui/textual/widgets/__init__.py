@@ -5,5 +5,6 @@ Includes :class:`~.confirm.Confirm`, :class:`~.report.Report`,
 :class:`~.field_from_schema.FieldFromSchema`,
 :class:`~.form_from_schema.FormFromSchema`,
 :class:`~.wizard_from_schema.WizardFromSchema`, and
-:class:`~.config_dialog.ConfigDialog`.
+:class:`~.config_dialog.ConfigDialog`, which share compiled validators
+through :func:`~.schema_validator.get_validator`.
 """
@@ -55,21 +55,44 @@ Usage example::
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 
-from jsonschema import Draft202012Validator, validate, ValidationError
+from jsonschema import Draft202012Validator
+from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import ModalScreen
-from textual.widgets import Button, Static, Tree
-
+from textual.widgets import (
+    Button,
+    Checkbox,
+    Input,
+    RadioSet,
+    SelectionList,
+    Static,
+    Tree,
+)
+from textual.widgets.tree import TreeNode
+
+from .field_from_schema import FieldFromSchema
 from .form_from_schema import FormFromSchema
+from .schema_validator import get_validator
+
+# Keywords that cannot reject an empty object: ``properties`` and
+# ``additionalProperties`` only constrain keys that are present.
+_EMPTY_SAFE_KEYWORDS = frozenset(
+    (
+        "$schema", "$id", "$comment", "$defs", "title", "description",
+        "default", "examples", "type", "properties", "additionalProperties",
+    )
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigPage:
     """A single page in the configuration hierarchy.
 
@@ -83,16 +106,17 @@ class ConfigPage:
         JSON Schema (Draft 2020-12) ``object`` definition for this page's
         form fields.
     children:
-        Optional list of child pages forming a sub-tree.
+        Optional sequence of child pages forming a sub-tree.  Leaf pages
+        share the empty tuple default instead of each owning a list.
     """
 
     id: str
     title: str
     schema: Dict[str, Any]
-    children: Optional[List["ConfigPage"]] = field(default_factory=list)
+    children: Optional[Sequence["ConfigPage"]] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigValues:
     """Per-page values container.
 
@@ -142,6 +166,12 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
         Binding("escape", "cancel", "Cancel", show=True),
     ]
 
+    FORM_CACHE_SIZE = 8
+    """Number of page forms kept mounted (hidden) for fast revisits."""
+
+    MAX_ERRORS = 20
+    """Validation stops once this many error messages were collected."""
+
     DEFAULT_CSS = """
     ConfigDialog {
         align: center middle;
@@ -224,6 +254,8 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
             The current configuration values dictionary.
         """
 
+        __slots__ = ("values",)
+
         def __init__(self, values: Dict[str, ConfigValues]) -> None:
             super().__init__()
             self.values = values
@@ -245,54 +277,93 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
         self._page_index: Dict[str, ConfigPage] = {}
         # Parent mapping: page_id -> parent_page_id (None for roots)
         self._parent_map: Dict[str, Optional[str]] = {}
+        # Page ids in tree pre-order (parents before children)
+        self._page_order: List[str] = []
+        # Position of each page in _page_order
+        self._page_pos: Dict[str, int] = {}
         self._current_page: Optional[ConfigPage] = None
         self._form: Optional[FormFromSchema] = None
-
-        self._index_pages(self._pages, None)
+        # Whether the shown form may hold values not yet saved to the store
+        self._form_dirty = False
+        # Mounted page forms, least recently shown first: page_id -> form
+        self._forms: "OrderedDict[str, FormFromSchema]" = OrderedDict()
+        # Compiled validators, built on first use: page_id -> validator
+        self._page_validators: Dict[str, Draft202012Validator] = {}
+        # Pages whose stored values changed since they were last validated
+        self._dirty_pages: Set[str] = set()
+        # Last validation errors of failing pages: page_id -> messages
+        self._page_errors: Dict[str, List[str]] = {}
+        # Error text waiting for the next refresh, and the text on screen
+        self._pending_error: Optional[str] = None
+        self._shown_error = ""
+        # Dialog button id -> handler (bound, so subclass overrides apply)
+        self._button_handlers: Dict[str, Callable[[], None]] = {
+            "cancel": self.action_cancel,
+            "apply": self._apply,
+            "accept": self._accept,
+        }
+
+        self._index_pages()
         self._load_initial_values()
 
     # ------------------------------------------------------------------
     # Initialisation helpers
     # ------------------------------------------------------------------
 
-    def _index_pages(
-        self, pages: List[ConfigPage], parent_id: Optional[str]
-    ) -> None:
-        """Build the flat page index and parent map recursively."""
-        for page in pages:
+    def _index_pages(self) -> None:
+        """Rebuild the flat page index, parent map and pre-order list."""
+        self._page_index.clear()
+        self._parent_map.clear()
+        self._page_order.clear()
+        self._page_pos.clear()
+        stack = [(page, None) for page in reversed(self._pages)]
+        while stack:
+            page, parent_id = stack.pop()
             self._page_index[page.id] = page
             self._parent_map[page.id] = parent_id
-            if page.children:
-                self._index_pages(page.children, page.id)
+            self._page_pos[page.id] = len(self._page_order)
+            self._page_order.append(page.id)
+            stack.extend((child, page.id) for child in reversed(page.children or ()))
 
     def _load_initial_values(self) -> None:
-        """Populate ``_page_values`` from the hierarchical initial values."""
-        self._walk_initial(self._pages, self._initial_values)
+        """Populate ``_page_values`` from the hierarchical initial values.
 
-    def _walk_initial(
-        self,
-        pages: List[ConfigPage],
-        values: Dict[str, ConfigValues],
-    ) -> None:
-        for page in pages:
-            cv = values.get(page.id)
-            if cv is not None:
-                self._page_values[page.id] = dict(cv.values)
-            if page.children and cv is not None:
-                self._walk_initial(page.children, cv.childs)
+        Every page is marked dirty so that it is validated at least once.
+        """
+        stack = [(self._pages, self._initial_values)]
+        while stack:
+            pages, values = stack.pop()
+            for page in pages:
+                cv = values.get(page.id)
+                if cv is None:
+                    continue
+                # Shared with the caller: the store is never mutated in
+                # place, _save_current_values swaps in a fresh dict.
+                self._page_values[page.id] = cv.values
+                if page.children:
+                    stack.append((page.children, cv.childs))
+        self._page_errors.clear()
+        self._dirty_pages = set(self._page_index)
 
     # ------------------------------------------------------------------
     # Compose
     # ------------------------------------------------------------------
 
     def compose(self) -> ComposeResult:
-        """Build the static widget tree."""
+        """Build the static widget tree.
+
+        The form area, tree and error widgets are kept as attributes so
+        later interactions do not need to query the DOM for them.
+        """
+        self._form_container = VerticalScroll(id="config-form-area")
+        self._tree = Tree("Pages", id="config-tree")
+        self._errors_static = Static("", id="config-errors")
         with Vertical(id="config-dialog"):
             yield Static(self._title, id="config-title")
             with Horizontal(id="config-body"):
-                yield VerticalScroll(id="config-form-area")
-                yield Tree("Pages", id="config-tree")
-            yield Static("", id="config-errors")
+                yield self._form_container
+                yield self._tree
+            yield self._errors_static
             with Horizontal(id="config-buttons"):
                 yield Button("Cancel", id="cancel", variant="error")
                 yield Button("Apply", id="apply", variant="warning")
@@ -305,7 +376,7 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
             self._current_page = self._pages[0]
             self._render_page_form(self._current_page)
             # Select the first tree node
-            tree = self.query_one("#config-tree", Tree)
+            tree = self._tree
             if tree.root.children:
                 tree.select_node(tree.root.children[0])
 
@@ -314,27 +385,44 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
     # ------------------------------------------------------------------
 
     def _build_tree(self) -> None:
-        """Populate the Tree widget from the page hierarchy."""
-        tree = self.query_one("#config-tree", Tree)
+        """Populate the Tree widget with the root pages and their children.
+
+        Deeper levels are added lazily, when their parent node is first
+        expanded (see :meth:`on_tree_node_expanded`).
+        """
+        tree = self._tree
         tree.root.expand()
         tree.show_root = False
         for page in self._pages:
-            node = tree.root.add(page.title, data=page)
-            node.expand()
+            node = self._add_tree_node(tree.root, page)
             if page.children:
-                self._add_tree_children(node, page.children)
+                self._add_tree_children(node)
+                node.expand()
+
+    def _add_tree_node(self, parent_node: TreeNode, page: ConfigPage) -> TreeNode:
+        return parent_node.add(page.title, data=page, allow_expand=bool(page.children))
+
+    def _add_tree_children(self, node: TreeNode) -> None:
+        """Add one level of child nodes under *node*, collapsed."""
+        for child in node.data.children or ():
+            self._add_tree_node(node, child)
 
-    def _add_tree_children(self, parent_node, children: List[ConfigPage]) -> None:
-        for child in children:
-            node = parent_node.add(child.title, data=child)
-            node.expand()
-            if child.children:
-                self._add_tree_children(node, child.children)
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Add the children of a page node the first time it is expanded."""
+        node = event.node
+        if node.data is not None and node.data.children and not node.children:
+            self._add_tree_children(node)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
-        """Switch form to the selected page."""
+        """Switch form to the selected page.
+
+        Reselecting the shown page is an identity check (not a deep
+        dataclass comparison of schemas and children), and leaving a page
+        that was only browsed does not read its form, see
+        :meth:`_save_current_values`.
+        """
         page = event.node.data
-        if page is None or page == self._current_page:
+        if page is None or page is self._current_page:
             return
         self._save_current_values()
         self._current_page = page
@@ -345,46 +433,68 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
     # ------------------------------------------------------------------
 
     def _render_page_form(self, page: ConfigPage) -> None:
-        """Clear and re-render the form area for *page*."""
-        container = self.query_one("#config-form-area", VerticalScroll)
-        container.remove_children()
-        self.query_one("#config-errors", Static).update("")
-
-        stored = self._page_values.get(page.id, {})
-        self._form = FormFromSchema(
-            page.schema,
-            initial_values=stored,
-            id_prefix=f"cfg-{page.id}",
-        )
-        container.mount(self._form)
+        """Show the form for *page*, building it on its first visit.
+
+        Forms are kept mounted and hidden when the user moves to another
+        page, so revisiting a page only toggles its visibility.  At most
+        :attr:`FORM_CACHE_SIZE` forms are kept; the least recently shown
+        one is removed first (its values were saved when it was left).
+        The switch is wrapped in a single batch update so Textual performs
+        one layout pass.
+        """
+        container = self._form_container
+        with self.app.batch_update():
+            self._set_error("")
+            if self._form is not None:
+                self._form.display = False
+
+            form = self._forms.get(page.id)
+            if form is None:
+                stored = self._page_values.get(page.id, {})
+                form = FormFromSchema(
+                    page.schema,
+                    initial_values=stored,
+                    id_prefix=f"cfg-{page.id}",
+                )
+                self._forms[page.id] = form
+                # A fresh form may fill in schema defaults: save it once.
+                self._form_dirty = True
+                container.mount(form)
+                while len(self._forms) > self.FORM_CACHE_SIZE:
+                    _, evicted = self._forms.popitem(last=False)
+                    evicted.remove()
+            else:
+                form.display = True
+                self._form_dirty = False
+            self._forms.move_to_end(page.id)
+            self._form = form
 
     # ------------------------------------------------------------------
     # Reading field values
     # ------------------------------------------------------------------
 
     def _save_current_values(self) -> None:
-        """Read all widget values for the current page into the store."""
+        """Read all widget values for the current page into the store.
+
+        Does nothing when the form was not edited since it was last saved.
+        """
         if self._current_page is None:
             return
         page = self._current_page
-        if self._form is None:
+        if self._form is None or not self._form_dirty:
             return
         self._page_values[page.id] = self._form.get_values()
-
-    # ------------------------------------------------------------------
-    # Array helpers
-    # ------------------------------------------------------------------
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Route button presses."""
-        bid = event.button.id or ""
-        if bid == "cancel":
-            self.action_cancel()
-        elif bid == "apply":
-            self._apply()
-        elif bid == "accept":
-            self._accept()
-
+        self._dirty_pages.add(page.id)
+        self._form_dirty = False
+
+    @on(Input.Changed)
+    @on(Checkbox.Changed)
+    @on(RadioSet.Changed)
+    @on(SelectionList.SelectedChanged)
+    @on(FieldFromSchema.ArrayChanged)
+    def _mark_form_dirty(self) -> None:
+        """Note that the shown form was edited."""
+        self._form_dirty = True
 
     # ------------------------------------------------------------------
     # Collecting / reconstructing values
@@ -393,20 +503,23 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
     def _collect_all_values(self) -> Dict[str, ConfigValues]:
         """Reconstruct the hierarchical values dict from the flat store."""
         self._save_current_values()
-        return self._build_values(self._pages)
+        return self._build_values()
+
+    def _build_values(self) -> Dict[str, ConfigValues]:
+        """Rebuild the page hierarchy in pre-order so parents exist first.
 
-    def _build_values(
-        self, pages: List[ConfigPage]
-    ) -> Dict[str, ConfigValues]:
+        Only pages holding values get their dict copied; the others get
+        a fresh empty :class:`ConfigValues`.
+        """
         result: Dict[str, ConfigValues] = {}
-        for page in pages:
-            child_vals: Dict[str, ConfigValues] = {}
-            if page.children:
-                child_vals = self._build_values(page.children)
-            result[page.id] = ConfigValues(
-                values=dict(self._page_values.get(page.id, {})),
-                childs=child_vals,
-            )
+        built: Dict[str, ConfigValues] = {}
+        for page_id in self._page_order:
+            stored = self._page_values.get(page_id)
+            cv = ConfigValues(values=dict(stored)) if stored else ConfigValues()
+            built[page_id] = cv
+            parent_id = self._parent_map[page_id]
+            siblings = result if parent_id is None else built[parent_id].childs
+            siblings[page_id] = cv
         return result
 
     # ------------------------------------------------------------------
@@ -416,22 +529,69 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
     def _validate_all(self) -> List[str]:
         """Validate every page against its schema.
 
+        Only pages whose values changed since their last validation are
+        re-validated; of the others, just the pages that failed last time
+        are visited to report their previous errors.  Errors are
+        streamed from the validator and collection stops after
+        :attr:`MAX_ERRORS` messages, leaving the remaining pages dirty.
+
         Returns a list of human-readable error strings.  Empty when valid.
         """
         self._save_current_values()
         errors: List[str] = []
-        for page_id, page in self._page_index.items():
-            data = self._page_values.get(page_id, {})
-            try:
-                validate(data, page.schema)
-            except ValidationError as e:
-                errors.append(f"{page.title}: {e.message}")
-        return errors
+        pending = sorted(
+            self._dirty_pages.union(self._page_errors),
+            key=self._page_pos.__getitem__,
+        )
+        for page_id in pending:
+            if len(errors) >= self.MAX_ERRORS:
+                break
+            if page_id in self._dirty_pages:
+                page = self._page_index[page_id]
+                data = self._page_values.get(page_id)
+                if not data and self._accepts_empty(page.schema):
+                    messages = []
+                else:
+                    page_errors = self._page_validator(page).iter_errors(data or {})
+                    messages = [
+                        f"{page.title}: {error.message}"
+                        for error in islice(page_errors, self.MAX_ERRORS)
+                    ]
+                if messages:
+                    self._page_errors[page_id] = messages
+                else:
+                    self._page_errors.pop(page_id, None)
+                self._dirty_pages.discard(page_id)
+            errors.extend(self._page_errors.get(page_id, ()))
+        return errors[: self.MAX_ERRORS]
+
+    @staticmethod
+    def _accepts_empty(schema: Dict[str, Any]) -> bool:
+        """Whether *schema* trivially accepts ``{}`` without validating it."""
+        return schema.get("type", "object") == "object" and (
+            schema.keys() <= _EMPTY_SAFE_KEYWORDS
+        )
+
+    def _page_validator(self, page: ConfigPage) -> Draft202012Validator:
+        """Return the compiled validator for *page*, building it once."""
+        validator = self._page_validators.get(page.id)
+        if validator is None:
+            # Page schemas are meta-checked, as jsonschema.validate did.
+            Draft202012Validator.check_schema(page.schema)
+            validator = get_validator(page.schema)
+            self._page_validators[page.id] = validator
+        return validator
 
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
 
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Route button presses."""
+        handler = self._button_handlers.get(event.button.id)
+        if handler is not None:
+            handler()
+
     def action_cancel(self) -> None:
         """Dismiss the dialog without saving."""
         self.dismiss(None)
@@ -440,25 +600,34 @@ class ConfigDialog(ModalScreen[Optional[Dict[str, ConfigValues]]]):
         """Validate and post an :class:`Applied` message."""
         errors = self._validate_all()
         if errors:
-            self.query_one("#config-errors", Static).update(
-                "\n".join(f"* {e}" for e in errors)
-            )
+            self._set_error("\n".join(f"* {e}" for e in errors))
             return
-        self.query_one("#config-errors", Static).update("")
-        values = self._collect_all_values()
+        self._set_error("")
+        values = self._build_values()
         self.post_message(self.Applied(values))
 
     def _accept(self) -> None:
         """Validate and dismiss with the collected values."""
         errors = self._validate_all()
         if errors:
-            self.query_one("#config-errors", Static).update(
-                "\n".join(f"* {e}" for e in errors)
-            )
+            self._set_error("\n".join(f"* {e}" for e in errors))
             return
-        values = self._collect_all_values()
+        values = self._build_values()
         self.dismiss(values)
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
+    def _set_error(self, message: str) -> None:
+        """Show *message* in the error area after the next refresh.
+
+        Several calls in the same frame (e.g. a page switch clearing the
+        area and a validation filling it) coalesce into one update.
+        """
+        if self._pending_error is None:
+            self.call_after_refresh(self._flush_error)
+        self._pending_error = message
+
+    def _flush_error(self) -> None:
+        message, self._pending_error = self._pending_error, None
+        if message is None or message == self._shown_error:
+            return
+        self._shown_error = message
+        self._errors_static.update(message)
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Set, Tuple
 
 from jsonschema import Draft202012Validator
+from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.message import Message
+from textual.widget import Widget
 from textual.widgets import (
     Button,
     Checkbox,
@@ -21,12 +27,122 @@ from textual.widgets import (
 )
 
 from .path_field import PathField
+from .schema_validator import get_validator
+
+_TRUE = frozenset(("true", "yes", "y", "1"))
+_FALSE = frozenset(("false", "no", "n", "0"))
+
+
+def _cast_bool(raw: str) -> bool:
+    lowered = raw.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError("Expected boolean (yes/no, true/false)")
+
+
+@lru_cache(maxsize=512, typed=True)
+def _label_text(name: str, description: Any, default: Any, required: bool) -> str:
+    label = name
+    if description:
+        label += f" — {description}"
+    if default is not None:
+        label += f" [default: {default}]"
+    if required:
+        label += " *"
+    return label
+
+
+@lru_cache(maxsize=512)
+def _field_ids(
+    name: str, wizard: bool
+) -> Tuple[str, str, str, str, Optional[str], str, str, str, str]:
+    # Rebuilt fields (wizard steps, reloaded config pages) reuse the same
+    # interned ids instead of formatting them again.
+    base = name if wizard else f"cfg-{name}"
+    list_id = sys.intern("array-items" if wizard else base)
+    return (
+        sys.intern(base),
+        list_id,
+        sys.intern("array-input" if wizard else f"{base}--input"),
+        sys.intern("array-add" if wizard else f"{base}--add"),
+        "array-input-row" if wizard else None,
+        sys.intern("array-selection" if wizard else base),
+        sys.intern(f"{base}--ac"),
+        sys.intern(f"{list_id}--header"),
+        sys.intern(base + "--"),
+    )
+
+
+_CASTERS: Dict[str, Callable[[str], Any]] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": _cast_bool,
+}
+
+
+def _caster_for(field_type: Any) -> Callable[[str], Any]:
+    """Return the caster for *field_type*; unsupported types raise on use."""
+    caster = _CASTERS.get(field_type) if isinstance(field_type, str) else None
+    if caster is not None:
+        return caster
+
+    def unsupported(raw: str) -> Any:
+        raise ValueError(f"Unsupported type {field_type}")
+
+    return unsupported
+
+
+# Python types of the JSON-Schema ``type`` names (bools are not numbers).
+_JSON_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+# Keywords that cannot reject a value once its ``type`` matches.
+_ANNOTATION_KEYWORDS = frozenset(
+    (
+        "type", "title", "description", "default", "examples", "$comment",
+        "readOnly", "writeOnly", "deprecated",
+    )
+)
+
+
+def _is_json_type(value: Any, name: str) -> bool:
+    if isinstance(value, bool) and name in ("integer", "number"):
+        return False
+    return isinstance(value, _JSON_TYPES[name])
 
 
 class FieldFromSchema(Vertical):
     """Render a single JSON-Schema field and manage its interactions."""
 
+    # No __slots__ here: Textual's widget bases keep a __dict__, so slots
+    # would not shrink instances.  All state is assigned in __init__, which
+    # keeps the instance dicts key-shared across fields.
+
+    class ArrayChanged(Message):
+        """Posted when an item is added to or removed from an array field."""
+
+        __slots__ = ("field",)
+
+        def __init__(self, field: "FieldFromSchema") -> None:
+            super().__init__()
+            self.field = field
+
     OBJECT_ARRAY_MAX_WIDTH = 24
+    ARRAY_RENDER_CHUNK = 20
+    """Array rows mounted up front; the rest are mounted as the list scrolls.
+
+    Two screens of the tallest array list (the wizard's, 10 rows high).
+    """
 
     def __init__(
         self,
@@ -39,211 +155,248 @@ class FieldFromSchema(Vertical):
     ) -> None:
         super().__init__()
         self._name = name
-        self._spec = dict(spec)
+        # Kept by reference: the spec is only read, never mutated.
+        self._spec = spec
+        # Resolved once: every read and validation consults these.
+        self._type: str = self._spec.get("type", "string")
+        self._required = bool(self._spec.get("x-required", False))
+        self._kind = self._field_kind(self._spec)
+        self._items_spec: Dict[str, Any] = self._spec.get("items", {})
+        self._object_items = self._is_object_array(self._items_spec)
+        self._unique_items = bool(self._spec.get("uniqueItems", False))
+        # Text inputs cast to the field type; free-text arrays to the item type.
+        self._caster = _caster_for(
+            self._items_spec.get("type", "string") if self._kind == "array" else self._type
+        )
+        self._plain_types = self._plain_type_check(self._spec)
         self._initial_value = initial_value
         self._mode = mode
         self._object_array_mode = object_array_mode
+        self._init_ids()
         self._array_values: List[Any] = []
+        # Set mirror of _array_values for uniqueItems checks on hashable
+        # items; None when items are objects or duplicates are allowed.
+        self._array_value_set: Optional[Set[Any]] = None
         self._array_widths: Dict[str, int] = {}
-        self._errors: List[str] = []
+        self._array_layout: List[Tuple[str, int, bool, str]] = []
+        self._array_width_rules: Optional[
+            Tuple[Tuple[Tuple[str, int], ...], int]
+        ] = None
+        self._errors: Tuple[str, ...] = ()
         self._label: Optional[Static] = None
         self._widget: Optional[object] = None
         self._list_view: Optional[ListView] = None
+        self._item_labels: List[Label] = []
         self._array_input: Optional[Input] = None
+        self._add_button: Optional[Button] = None
         self._header: Optional[Static] = None
-
-    def on_mount(self) -> None:
-        self._build()
-
-    def _build(self) -> None:
-        self.remove_children()
-        label_text = self._build_label(self._name, self._spec, self._is_required())
+        self._item_validator: Optional[Draft202012Validator] = None
+        self._validator: Optional[Draft202012Validator] = None
+        # Id of the pressed radio button, kept by on_radio_set_changed.
+        self._radio_selection: Optional[str] = None
+        # Radio button id -> option value as declared in the schema.
+        self._radio_options: Dict[str, Any] = {}
+
+    def compose(self) -> ComposeResult:
+        # Composed rather than mounted from on_mount: the field's widgets
+        # arrive with the field itself, in its first layout pass.
+        label_text = self._build_label(self._name, self._spec, self._required)
         self._label = Static(label_text, classes=self._label_class())
+        yield from self._BUILDERS[self._kind](self, label_text)
 
+    def _build_path(self, label_text: str) -> List[Widget]:
         spec = self._spec
-        if spec.get("type") == "string" and spec.get("format") == "directory":
-            root_dir = None
-            if isinstance(spec.get("x-root-dir"), str) and spec.get("x-root-dir"):
-                root_dir = self._path_root(spec)
-            self._widget = PathField(
-                root_dir=root_dir,
-                must_exist=spec.get("x-must-exist", True),
-                warn_if_exists=spec.get("x-warn-if-exists", False),
-                select="dir",
-                initial_path=self._path_initial(),
-                name_filter=spec.get("x-name-filter"),
-                relative_check_path=self._path_relative_check(spec),
-                max_suggestions=spec.get("x-max-suggestions", 30),
-                placeholder=str(root_dir),
-                input_id=self._input_id(),
-                autocomplete_id=f"{self._base_id()}--ac",
+        root_dir = None
+        if isinstance(spec.get("x-root-dir"), str) and spec.get("x-root-dir"):
+            root_dir = self._path_root(spec)
+        self._widget = PathField(
+            root_dir=root_dir,
+            must_exist=spec.get("x-must-exist", True),
+            warn_if_exists=spec.get("x-warn-if-exists", False),
+            select="dir",
+            initial_path=self._path_initial(),
+            name_filter=spec.get("x-name-filter"),
+            relative_check_path=self._path_relative_check(spec),
+            max_suggestions=spec.get("x-max-suggestions", 30),
+            placeholder=str(root_dir),
+            input_id=self._input_id,
+            autocomplete_id=self._autocomplete_id,
+        )
+        if self._include_input_label():
+            return [self._label, self._widget]
+        return [self._widget]
+
+    def _build_radio(self, label_text: str) -> List[Widget]:
+        initial = None if self._initial_value is None else str(self._initial_value)
+        buttons = [
+            self._radio_button(pos, title, const, raw == initial)
+            for pos, (title, const, raw) in enumerate(self._choices(self._spec))
+        ]
+        rs = RadioSet(*buttons, id=self._base_id)
+        self._widget = rs
+        return [self._label, rs]
+
+    def _build_checkbox(self, label_text: str) -> List[Widget]:
+        cb = Checkbox(label_text, id=self._base_id)
+        if self._initial_value is not None:
+            cb.value = bool(self._initial_value)
+        self._widget = cb
+        return [cb]
+
+    def _build_array_select(self, label_text: str) -> List[Widget]:
+        initial = {str(v) for v in self._initial_value or []}
+        options = [
+            (title, raw, raw in initial)
+            for title, _, raw in self._choices(self._items_spec)
+        ]
+        sl = SelectionList[str](*options, id=self._selection_id)
+        self._widget = sl
+        return [self._label, sl]
+
+    def _build_array(self, label_text: str) -> List[Widget]:
+        self._array_values = list(self._initial_value or [])
+        self._array_value_set = self._unique_value_set()
+        self._set_array_widths(self._compute_widths(self._array_values))
+        header_line = self._format_header()
+        children: List[Widget] = [self._label]
+        if header_line and self._mode != "wizard":
+            self._header = Static(
+                header_line,
+                id=self._header_id,
+                classes="config-array-header",
             )
-            if self._include_input_label():
-                self.mount(self._label, self._widget)
-            else:
-                self.mount(self._widget)
-            return
-        if "oneOf" in spec:
-            buttons = []
-            for opt in spec["oneOf"]:
-                title = opt.get("title", opt.get("const"))
-                const = opt.get("const")
-                button_id = f"{self._base_id()}--{const}"
-                buttons.append(RadioButton(title, id=button_id))
-            rs = RadioSet(*buttons, id=self._base_id())
-            if self._initial_value is not None:
-                selected_id = f"{self._base_id()}--{self._initial_value}"
-                for rb in rs.query(RadioButton):
-                    if rb.id == selected_id:
-                        rb.value = True
-                        break
-            self._widget = rs
-            self.mount(self._label, rs)
-            return
-
-        if "enum" in spec:
-            buttons = []
-            for opt in spec["enum"]:
-                button_id = f"{self._base_id()}--{opt}"
-                buttons.append(RadioButton(str(opt), id=button_id))
-            rs = RadioSet(*buttons, id=self._base_id())
-            if self._initial_value is not None:
-                selected_id = f"{self._base_id()}--{self._initial_value}"
-                for rb in rs.query(RadioButton):
-                    if rb.id == selected_id:
-                        rb.value = True
-                        break
-            self._widget = rs
-            self.mount(self._label, rs)
-            return
+            children.append(self._header)
 
-        if spec.get("type") == "boolean":
-            cb = Checkbox(label_text, id=self._base_id())
-            if self._initial_value is not None:
-                cb.value = bool(self._initial_value)
-            self._widget = cb
-            self.mount(cb)
-            return
-
-        if spec.get("type") == "array":
-            items_spec = spec.get("items", {})
-            if "oneOf" in items_spec or "enum" in items_spec:
-                options = []
-                if "oneOf" in items_spec:
-                    for opt in items_spec["oneOf"]:
-                        val = opt.get("const")
-                        title = opt.get("title", str(val))
-                        options.append((title, str(val)))
-                else:
-                    for opt in items_spec["enum"]:
-                        options.append((str(opt), str(opt)))
-
-                sl = SelectionList[str](*options, id=self._selection_id())
-                for v in self._initial_value or []:
-                    sl.select(str(v))
-                self._widget = sl
-                self.mount(self._label, sl)
-                return
-
-            self._array_values = list(self._initial_value or [])
-            self._array_widths = self._compute_widths(items_spec, self._array_values)
-            header_line = self.format_array_header(items_spec, self._array_widths)
-            if header_line and self._mode != "wizard":
-                self._header = Static(
-                    header_line,
-                    id=f"{self._list_id()}--header",
-                    classes="config-array-header",
-                )
-                self.mount(self._label, self._header)
-            else:
-                self.mount(self._label)
-
-            self._list_view = ListView(
-                *[
-                    ListItem(
-                        Label(self.format_array_item(items_spec, v, self._array_widths))
-                    )
-                    for v in self._array_values
-                ],
-                id=self._list_id(),
-                classes="config-array-items" if self._mode == "form" else None,
-            )
+        self._item_labels = self._array_labels(0, self.ARRAY_RENDER_CHUNK)
+        self._list_view = ListView(
+            *[ListItem(label) for label in self._item_labels],
+            id=self._list_id,
+            classes="config-array-items" if self._mode == "form" else None,
+        )
+        self.watch(self._list_view, "scroll_y", self._on_array_scroll, init=False)
 
-            add_id = self._add_id()
-            if self._is_object_array(items_spec) and self._object_array_mode == "modal":
-                row = Horizontal(
-                    Button("Add", id=add_id),
-                    id=self._row_id(),
-                    classes="config-array-row" if self._mode == "form" else None,
-                )
-                self.mount(self._list_view, row)
-                return
-
-            self._array_input = Input(
-                placeholder="Add item and press Enter",
-                id=self._input_id(),
-            )
+        self._add_button = Button("Add", id=self._add_id)
+        if self._object_items and self._object_array_mode == "modal":
             row = Horizontal(
-                self._array_input,
-                Button("Add", id=add_id),
-                id=self._row_id(),
+                self._add_button,
+                id=self._row_id,
                 classes="config-array-row" if self._mode == "form" else None,
             )
-            self.mount(self._list_view, row)
-            return
+            children += [self._list_view, row]
+            return children
 
-        inp = Input(placeholder=label_text, id=self._base_id())
+        self._array_input = Input(
+            placeholder="Add item and press Enter",
+            id=self._input_id,
+        )
+        row = Horizontal(
+            self._array_input,
+            self._add_button,
+            id=self._row_id,
+            classes="config-array-row" if self._mode == "form" else None,
+        )
+        children += [self._list_view, row]
+        return children
+
+    def _build_input(self, label_text: str) -> List[Widget]:
+        inp = Input(placeholder=label_text, id=self._base_id)
         if self._initial_value is not None:
             inp.value = str(self._initial_value)
         self._widget = inp
         if self._include_input_label():
-            self.mount(self._label, inp)
+            return [self._label, inp]
+        return [inp]
+
+    # Widget builder per field kind (see _field_kind).
+    _BUILDERS: ClassVar[
+        Dict[str, Callable[["FieldFromSchema", str], List[Widget]]]
+    ] = {
+        "path": _build_path,
+        "radio": _build_radio,
+        "checkbox": _build_checkbox,
+        "array-select": _build_array_select,
+        "array": _build_array,
+        "input": _build_input,
+    }
+
+    @staticmethod
+    def _choices(spec: Dict[str, Any]) -> List[Tuple[str, Any, str]]:
+        """Return ``(title, const, const as text)`` for each option of *spec*.
+
+        Shared by radio fields and multi-select arrays (given ``items``).
+        """
+        choices: List[Tuple[str, Any, str]] = []
+        if "oneOf" in spec:
+            for opt in spec["oneOf"]:
+                const = opt.get("const")
+                raw = str(const)
+                choices.append((opt.get("title", raw), const, raw))
         else:
-            self.mount(inp)
+            for opt in spec["enum"]:
+                raw = str(opt)
+                choices.append((raw, opt, raw))
+        return choices
+
+    def _radio_button(
+        self, pos: int, title: Any, const: Any, selected: bool
+    ) -> RadioButton:
+        # Ids are positional: option values need not be valid identifiers
+        # ("a b", 1.5) and never have to be parsed back from the id.
+        button_id = sys.intern(self._radio_prefix + str(pos))
+        self._radio_options[button_id] = const
+        if selected:
+            self._radio_selection = button_id
+        return RadioButton(title, value=selected, id=button_id)
 
     def get_value(self) -> Any:
-        if isinstance(self._widget, SelectionList):
-            return list(self._widget.selected)
-
-        if self._spec.get("type") == "array":
+        kind = self._kind
+        if kind == "array":
             return list(self._array_values)
 
-        if isinstance(self._widget, PathField):
-            return self._widget.get_value()
-
-        if isinstance(self._widget, RadioSet):
-            prefix = f"{self._base_id()}--"
-            for btn in self._widget.query(RadioButton):
-                if btn.value and btn.id and btn.id.startswith(prefix):
-                    raw = btn.id[len(prefix):]
-                    return self._cast_value(raw, self._spec.get("type", "string"))
+        if self._widget is None:
             return None
 
-        if isinstance(self._widget, Checkbox):
-            return self._widget.value
+        if kind == "array-select":
+            return list(self._widget.selected)
 
-        if isinstance(self._widget, Input):
-            raw = self._widget.value.strip()
-            if not raw:
+        if kind == "path":
+            return self._widget.get_value()
+
+        if kind == "radio":
+            if self._radio_selection is None:
                 return None
-            return self._cast_value(raw, self._spec.get("type", "string"))
+            return self._radio_options[self._radio_selection]
 
-        return None
+        if kind == "checkbox":
+            return self._widget.value
+
+        raw = self._widget.value.strip()
+        if not raw:
+            return None
+        return self._caster(raw)
 
     def is_valid(self) -> bool:
-        self._errors = []
+        self._errors = ()
         value = self.get_value()
-        if value is None and not self._is_required():
+        if value is None and not self._required:
             return True
-        schema = {
-            "type": "object",
-            "properties": {self._name: self._spec},
-            "required": [self._name] if self._is_required() else [],
-        }
-        instance = {self._name: value}
-        v = Draft202012Validator(schema)
-        self._errors = [e.message for e in v.iter_errors(instance)]
-        return not self._errors
+        if self._plain_types and any(_is_json_type(value, t) for t in self._plain_types):
+            return True
+        validator = self._field_validator()
+        # is_valid stops at the first error; messages are only collected
+        # for values that actually fail.
+        if validator.is_valid(value):
+            return True
+        self._errors = tuple(e.message for e in validator.iter_errors(value))
+        return False
+
+    def _field_validator(self) -> Draft202012Validator:
+        # The value is validated against the field spec itself: wrapping
+        # it in a one-property object adds nothing (the key is always
+        # present) and would key the shared cache by field name too.
+        if self._validator is None:
+            self._validator = get_validator(self._spec)
+        return self._validator
 
     def get_errors(self) -> List[str]:
         return list(self._errors)
@@ -252,70 +405,139 @@ class FieldFromSchema(Vertical):
         return self.get_value() != self._initial_value
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id != self._add_id():
+        if self._add_button is None or event.button is not self._add_button:
             return
         event.stop()
         self.run_worker(self.add_to_array)
 
+    def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
+        if event.radio_set is not self._widget:
+            return
+        if event.pressed.id in self._radio_options:
+            self._radio_selection = event.pressed.id
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        if event.input.id != self._input_id():
+        if self._array_input is None or event.input is not self._array_input:
             return
+        # Enter on an empty array input is left to bubble: the wizard
+        # takes it as "next step".
+        if not event.value.strip():
+            return
+        event.stop()
         self.run_worker(self.add_to_array)
 
     def focus_first(self) -> None:
-        if isinstance(self._widget, PathField):
-            self._widget.focus_input()
-            return
-        for widget_type in (Input, SelectionList, RadioSet, Checkbox, Button):
-            try:
-                widget = self.query_one(widget_type)
-            except Exception:
-                continue
-            widget.focus()
+        if self._kind == "path":
+            if self._widget is not None:
+                self._widget.focus_input()
             return
+        if self._kind == "array":
+            target = self._array_input or self._add_button
+        else:
+            target = self._widget
+        if target is not None:
+            target.focus()
 
     def on_key(self, event) -> None:
-        if self._list_view is None:
+        # Only free-text arrays have a list view: every other field
+        # returns here without looking at the key.
+        list_view = self._list_view
+        if list_view is None:
             return
-        if event.key == "up" and self._array_values:
-            if self._list_view.index is None:
-                self._list_view.index = len(self._array_values) - 1
-            elif self._list_view.index > 0:
-                self._list_view.index -= 1
-            event.prevent_default()
-            event.stop()
+        handler = self._KEY_HANDLERS.get(event.key)
+        # index is a reactive: read it once per key press.
+        if handler is None or not handler(self, list_view, list_view.index):
+            return
+        event.prevent_default()
+        event.stop()
+
+    def _key_up(self, list_view: ListView, index: Optional[int]) -> bool:
+        count = len(self._array_values)
+        if not count:
+            return False
+        if index is None:
+            self._render_more_items(count)
+            list_view.index = count - 1
+        elif index > 0:
+            list_view.index = index - 1
+        return True
+
+    def _key_down(self, list_view: ListView, index: Optional[int]) -> bool:
+        if index is None:
+            return False
+        last = len(self._item_labels) - 1
+        if index == last:
+            self._render_more_items()
+            last = len(self._item_labels) - 1
+        list_view.index = index + 1 if index < last else None
+        return True
+
+    def _key_delete(self, list_view: ListView, index: Optional[int]) -> bool:
+        if index is None:
+            return False
+        if self._array_input is not None and self._array_input.value:
+            return False
+        if index < 0 or index >= len(self._array_values):
+            return False
+        self.remove_array_items([index])
+        return True
+
+    # Array list key handlers; each returns whether it consumed the key.
+    _KEY_HANDLERS: ClassVar[
+        Dict[str, Callable[["FieldFromSchema", ListView, Optional[int]], bool]]
+    ] = {
+        "up": _key_up,
+        "down": _key_down,
+        "backspace": _key_delete,
+        "delete": _key_delete,
+    }
+
+    def remove_array_items(self, indices: Iterable[int]) -> None:
+        """Remove the array items at *indices* in a single DOM update."""
+        if self._list_view is None:
             return
-        if event.key == "down" and self._list_view.index is not None:
-            if self._list_view.index < len(self._array_values) - 1:
-                self._list_view.index += 1
-            else:
-                self._list_view.index = None
-            event.prevent_default()
-            event.stop()
+        doomed = {i for i in indices if 0 <= i < len(self._array_values)}
+        if not doomed:
             return
-        if event.key in ("backspace", "delete") and self._list_view.index is not None:
-            if self._array_input is not None and self._array_input.value:
-                return
-            idx = self._list_view.index
-            if idx is None or idx < 0 or idx >= len(self._array_values):
-                return
-            self._array_values.pop(idx)
-            self._list_view.children[idx].remove()
-            if not self._array_values:
-                self._list_view.index = None
-            elif idx >= len(self._array_values):
-                self._list_view.index = len(self._array_values) - 1
-            event.prevent_default()
-            event.stop()
+        rows = self._list_view.children
+        self._list_view.remove_children(
+            [rows[i] for i in sorted(doomed) if i < len(self._item_labels)]
+        )
+        if len(doomed) == 1:
+            # Delete/backspace removes one row per key press: drop it in
+            # place instead of rebuilding every list.
+            (index,) = doomed
+            value = self._array_values.pop(index)
+            if index < len(self._item_labels):
+                del self._item_labels[index]
+            unique = self._array_value_set
+            if unique is not None and value not in self._array_values:
+                unique.discard(value)
+            removed = [value]
+        else:
+            removed = [self._array_values[i] for i in doomed]
+            self._array_values = [
+                v for i, v in enumerate(self._array_values) if i not in doomed
+            ]
+            if self._array_value_set is not None:
+                # Rebuilt rather than discarded from: initial values may repeat.
+                self._array_value_set = set(self._array_values)
+            self._item_labels = [
+                label for i, label in enumerate(self._item_labels) if i not in doomed
+            ]
+        self._shrink_array_widths(removed)
+        self.post_message(self.ArrayChanged(self))
+        index = self._list_view.index
+        if not self._item_labels:
+            self._list_view.index = None
+        elif index is not None and index >= len(self._item_labels):
+            self._list_view.index = len(self._item_labels) - 1
 
     async def add_to_array(self) -> Optional[str]:
-        spec = self._spec
-        items_spec = spec.get("items", {})
-
-        if self._is_object_array(items_spec):
+        if self._object_items:
             from .wizard_from_schema import WizardFromSchema
 
-            item_schema = dict(items_spec)
+            item_schema = dict(self._items_spec)
             item_schema.setdefault("type", "object")
             result = await self.app.push_screen_wait(WizardFromSchema(item_schema))
             if result is None:
@@ -327,46 +549,142 @@ class FieldFromSchema(Vertical):
             raw = self._array_input.value.strip()
             if not raw:
                 return None
-            item_type = items_spec.get("type", "string")
             try:
-                value = self._cast_value(raw, item_type)
+                value = self._caster(raw)
             except ValueError as e:
                 return str(e)
 
-        v = Draft202012Validator(items_spec)
-        item_errors = [e.message for e in v.iter_errors(value)]
-        if item_errors:
-            return "\n".join(f"* {e}" for e in item_errors)
+        item_validator = self._items_validator()
+        if not item_validator.is_valid(value):
+            return "\n".join(f"* {e.message}" for e in item_validator.iter_errors(value))
 
-        if spec.get("uniqueItems", False) and value in self._array_values:
+        unique = self._array_value_set
+        if unique is not None:
+            if value in unique:
+                return "Duplicate value not allowed"
+            unique.add(value)
+        elif self._unique_items and value in self._array_values:
             return "Duplicate value not allowed"
 
         self._array_values.append(value)
-        if self._array_input is not None and not self._is_object_array(items_spec):
+        self.post_message(self.ArrayChanged(self))
+        if self._array_input is not None and not self._object_items:
             self._array_input.value = ""
             self._array_input.focus()
 
         if self._list_view is None:
             return None
 
-        self._array_widths = self._compute_widths(items_spec, self._array_values)
-        self._list_view.append(
-            ListItem(Label(self.format_array_item(items_spec, value, self._array_widths)))
+        # Columns only grow to fit the new item; rows are re-laid out only
+        # when a column actually widened.
+        added = self._compute_widths([value])
+        widths = {
+            key: max(width, self._array_widths.get(key, 0))
+            for key, width in added.items()
+        }
+        widened = widths != self._array_widths
+        if widened:
+            self._set_array_widths(widths)
+        # Rows already on screen before this add (the new one is current).
+        stale = len(self._item_labels)
+        if stale == len(self._array_values) - 1:
+            label = Label(self._format_row(value))
+            self._item_labels.append(label)
+            self._list_view.append(ListItem(label))
+
+        if not widened:
+            return None
+        with self.app.batch_update():
+            if self._header is not None:
+                self._header.update(self._format_header())
+            # zip stops at the rows rendered before the add: no slice copy
+            # and no per-row bounds check.
+            format_row = self._format_row
+            for label, item in zip(islice(self._item_labels, stale), self._array_values):
+                label.update(format_row(item))
+        return None
+
+    def _array_labels(self, start: int, stop: int) -> List[Label]:
+        return [Label(self._format_row(v)) for v in self._array_values[start:stop]]
+
+    def _unique_value_set(self) -> Optional[Set[Any]]:
+        if not self._unique_items or self._object_items:
+            return None
+        try:
+            return set(self._array_values)
+        except TypeError:
+            return None
+
+    def _shrink_array_widths(self, removed: List[Any]) -> None:
+        """Re-fit the columns after *removed* left the array.
+
+        Widths are only recomputed when a removed row held a measured column
+        at its current width (fixed-width columns never change); the
+        remaining rows are re-laid out if any column actually narrowed.
+        """
+        current = self._array_widths
+        if not current:
+            return
+        columns, _ = self._width_rules()
+        held = self._compute_widths(removed)
+        if not any(
+            not fixed and held[key] == current.get(key) for key, fixed in columns
+        ):
+            return
+        widths = self._compute_widths(self._array_values)
+        if widths == current:
+            return
+        self._set_array_widths(widths)
+        with self.app.batch_update():
+            if self._header is not None:
+                self._header.update(self._format_header())
+            format_row = self._format_row
+            for label, item in zip(self._item_labels, self._array_values):
+                label.update(format_row(item))
+
+    def _set_array_widths(self, widths: Dict[str, int]) -> None:
+        self._array_widths = widths
+        self._array_layout = self._row_layout(self._items_spec, widths)
+
+    def _format_header(self) -> str:
+        """Header line from the precomputed column layout (see _format_row)."""
+        cell = self._format_cell
+        return " | ".join(
+            cell(key, width, trim, side)
+            for key, width, trim, side in self._array_layout
         )
 
-        if self._header is not None:
-            self._header.update(self.format_array_header(items_spec, self._array_widths))
-        for idx, li in enumerate(self._list_view.children):
-            if idx >= len(self._array_values):
-                break
-            try:
-                label = li.query_one(Label)
-            except Exception:
-                continue
-            label.update(
-                self.format_array_item(items_spec, self._array_values[idx], self._array_widths)
-            )
-        return None
+    def _format_row(self, value: Any) -> str:
+        # The precomputed layout spares re-reading the items spec per row.
+        return self.format_array_item(
+            self._items_spec, value, self._array_widths, layout=self._array_layout
+        )
+
+    def _render_more_items(self, count: Optional[int] = None) -> None:
+        """Mount the next *count* pending array rows (a chunk by default)."""
+        if self._list_view is None:
+            return
+        start = len(self._item_labels)
+        labels = self._array_labels(start, start + (count or self.ARRAY_RENDER_CHUNK))
+        if not labels:
+            return
+        self._item_labels.extend(labels)
+        self._list_view.extend(ListItem(label) for label in labels)
+
+    def _on_array_scroll(self, scroll_y: float) -> None:
+        if self._list_view is not None and scroll_y >= self._list_view.max_scroll_y - 1:
+            self._render_more_items()
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        if event.list_view is not self._list_view:
+            return
+        if self._list_view.index == len(self._item_labels) - 1:
+            self._render_more_items()
+
+    def _items_validator(self) -> Draft202012Validator:
+        if self._item_validator is None:
+            self._item_validator = get_validator(self._items_spec)
+        return self._item_validator
 
     def _label_class(self) -> Optional[str]:
         if self._mode == "form":
@@ -376,28 +694,19 @@ class FieldFromSchema(Vertical):
     def _include_input_label(self) -> bool:
         return self._mode == "form"
 
-    def _is_required(self) -> bool:
-        return bool(self._spec.get("x-required", False))
-
-    def _base_id(self) -> str:
-        if self._mode == "wizard":
-            return self._name
-        return f"cfg-{self._name}"
-
-    def _list_id(self) -> str:
-        return "array-items" if self._mode == "wizard" else self._base_id()
-
-    def _input_id(self) -> str:
-        return "array-input" if self._mode == "wizard" else f"{self._base_id()}--input"
-
-    def _add_id(self) -> str:
-        return "array-add" if self._mode == "wizard" else f"{self._base_id()}--add"
-
-    def _row_id(self) -> str | None:
-        return "array-input-row" if self._mode == "wizard" else None
-
-    def _selection_id(self) -> str:
-        return "array-selection" if self._mode == "wizard" else self._base_id()
+    def _init_ids(self) -> None:
+        """Derive every widget id of this field once, interned."""
+        (
+            self._base_id,
+            self._list_id,
+            self._input_id,
+            self._add_id,
+            self._row_id,
+            self._selection_id,
+            self._autocomplete_id,
+            self._header_id,
+            self._radio_prefix,
+        ) = _field_ids(self._name, self._mode == "wizard")
 
     def _path_root(self, spec: Dict[str, Any]) -> Path:
         root = spec.get("x-root-dir")
@@ -421,62 +730,108 @@ class FieldFromSchema(Vertical):
 
     @staticmethod
     def _build_label(name: str, spec: Dict[str, Any], required: bool) -> str:
-        label = name
-        if spec.get("description"):
-            label += f" — {spec['description']}"
+        description = spec.get("description")
         default = spec.get("default")
-        if default is not None:
-            label += f" [default: {default}]"
-        if required:
-            label += " *"
-        return label
+        try:
+            return _label_text(name, description, default, required)
+        except TypeError:
+            # Unhashable default (list/object): format without the cache.
+            return _label_text.__wrapped__(name, description, default, required)
+
+    @staticmethod
+    def _plain_type_check(spec: Dict[str, Any]) -> Tuple[str, ...]:
+        """Return the type names when *spec* only constrains the type.
+
+        Such fields are validated with an ``isinstance`` check and only
+        reach the JSON-Schema validator (for its messages) on a mismatch.
+        Returns an empty tuple when other keywords need the validator.
+        """
+        types = spec.get("type")
+        if isinstance(types, str):
+            types = (types,)
+        if not isinstance(types, (list, tuple)) or not all(
+            t in _JSON_TYPES for t in types
+        ):
+            return ()
+        for key in spec:
+            if key not in _ANNOTATION_KEYWORDS and not key.startswith("x-"):
+                return ()
+        return tuple(types)
+
+    @staticmethod
+    def _field_kind(spec: Dict[str, Any]) -> str:
+        """Classify *spec* by the widget that renders it."""
+        field_type = spec.get("type")
+        if field_type == "string" and spec.get("format") == "directory":
+            return "path"
+        if "oneOf" in spec or "enum" in spec:
+            return "radio"
+        if field_type == "boolean":
+            return "checkbox"
+        if field_type == "array":
+            items_spec = spec.get("items", {})
+            if "oneOf" in items_spec or "enum" in items_spec:
+                return "array-select"
+            return "array"
+        return "input"
 
     @staticmethod
     def is_free_text_array(spec: Dict[str, Any]) -> bool:
-        if spec.get("type") != "array":
-            return False
-        items_spec = spec.get("items", {})
-        return "oneOf" not in items_spec and "enum" not in items_spec
+        """Whether *spec* renders as an editable list (the ``array`` kind).
+
+        Fields keep this as ``_kind``, computed once in ``__init__``.
+        """
+        return FieldFromSchema._field_kind(spec) == "array"
 
     @staticmethod
     def _is_object_array(items_spec: Dict[str, Any]) -> bool:
         return items_spec.get("type") == "object" or "properties" in items_spec
 
-    def _compute_widths(
-        self,
-        items_spec: Dict[str, Any],
-        values: List[Any],
-    ) -> Dict[str, int]:
+    def _compute_widths(self, values: List[Any]) -> Dict[str, int]:
+        """Column widths fitting *values*, within the width rules."""
+        columns, max_width = self._width_rules()
+        widths: Dict[str, int] = {}
+        for key, fixed in columns:
+            if fixed:
+                widths[key] = fixed
+                continue
+            best = len(key)
+            for item in values:
+                if isinstance(item, dict):
+                    best = max(best, len(str(item.get(key, ""))))
+            widths[key] = min(max_width, best)
+        return widths
+
+    def _width_rules(self) -> Tuple[Tuple[Tuple[str, int], ...], int]:
+        """Return ``((key, fixed width), ...), max width``, built once.
+
+        Columns sized by ``x-column-widths`` or ``x-width`` get their fixed
+        width; the others get ``0`` and are measured against the values up
+        to ``x-maxWidth``.
+        """
+        if self._array_width_rules is not None:
+            return self._array_width_rules
+        items_spec = self._items_spec
         max_width = items_spec.get("x-maxWidth")
         if not isinstance(max_width, int):
             max_width = self.OBJECT_ARRAY_MAX_WIDTH
-        props = items_spec.get("properties", {})
         overrides = items_spec.get("x-column-widths", {})
-        widths: Dict[str, int] = {}
-        for key in props.keys():
-            prop_spec = props.get(key, {})
+        columns: List[Tuple[str, int]] = []
+        for key, prop_spec in items_spec.get("properties", {}).items():
+            fixed = 0
             if isinstance(overrides, dict) and key in overrides:
                 try:
-                    widths[key] = max(1, int(overrides[key]))
-                    continue
+                    fixed = max(1, int(overrides[key]))
                 except (TypeError, ValueError):
                     pass
-            if "x-width" in prop_spec:
+            if not fixed and "x-width" in prop_spec:
                 try:
-                    widths[key] = max(1, int(prop_spec["x-width"]))
-                    continue
+                    fixed = max(1, int(prop_spec["x-width"]))
                 except (TypeError, ValueError):
                     pass
-
-            best = len(str(key))
-            for item in values:
-                if isinstance(item, dict):
-                    raw = str(item.get(key, ""))
-                else:
-                    raw = ""
-                best = max(best, len(raw))
-            widths[key] = min(max_width, best)
-        return widths
+            columns.append((key, fixed))
+        self._array_width_rules = (tuple(columns), max_width)
+        return self._array_width_rules
 
     @staticmethod
     def format_array_header(
@@ -490,13 +845,7 @@ class FieldFromSchema(Vertical):
         for key in props.keys():
             width = widths.get(key, len(key)) if widths else len(key)
             trim, side = FieldFromSchema._trim_config(props.get(key, {}))
-            if width and trim:
-                cell = FieldFromSchema._trim_pad(str(key), width, side)
-            elif width:
-                cell = str(key).ljust(width)
-            else:
-                cell = str(key)
-            parts.append(cell)
+            parts.append(FieldFromSchema._format_cell(str(key), width, trim, side))
         return " | ".join(parts)
 
     @staticmethod
@@ -504,39 +853,58 @@ class FieldFromSchema(Vertical):
         items_spec: Dict[str, Any],
         value: Any,
         widths: Optional[Dict[str, int]] = None,
+        layout: Optional[List[Tuple[str, int, bool, str]]] = None,
     ) -> str:
-        if FieldFromSchema._is_object_array(items_spec) and isinstance(value, dict):
-            props = items_spec.get("properties", {})
-            parts = []
-            for key in props.keys():
-                val = value.get(key, "")
-                width = widths.get(key, 0) if widths else 0
-                trim, side = FieldFromSchema._trim_config(props.get(key, {}))
-                if width and trim:
-                    cell = FieldFromSchema._trim_pad(str(val), width, side)
-                elif width:
-                    cell = str(val).ljust(width)
-                else:
-                    cell = str(val)
-                parts.append(cell)
-            if parts:
-                return " | ".join(parts)
-        return str(value)
+        """Format one array row; pass a precomputed *layout* to skip
+        re-reading the column specs (see :meth:`_row_layout`)."""
+        if not isinstance(value, dict):
+            return str(value)
+        if layout is None:
+            layout = FieldFromSchema._row_layout(items_spec, widths)
+        if not layout:
+            return str(value)
+        return " | ".join(
+            FieldFromSchema._format_cell(str(value.get(key, "")), width, trim, side)
+            for key, width, trim, side in layout
+        )
+
+    @staticmethod
+    def _row_layout(
+        items_spec: Dict[str, Any],
+        widths: Optional[Dict[str, int]],
+    ) -> List[Tuple[str, int, bool, str]]:
+        """Resolve ``(key, width, trim, side)`` per column of an object array."""
+        if not FieldFromSchema._is_object_array(items_spec):
+            return []
+        layout = []
+        for key, prop_spec in items_spec.get("properties", {}).items():
+            width = widths.get(key, 0) if widths else 0
+            trim, side = FieldFromSchema._trim_config(prop_spec)
+            layout.append((key, width, trim, side))
+        return layout
 
     @staticmethod
+    def _format_cell(text: str, width: int, trim: bool, side: str) -> str:
+        if width and trim:
+            return FieldFromSchema._trim_pad(text, width, side)
+        if width:
+            return text.ljust(width)
+        return text
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def _trim_pad(value: str, width: int, side: str = "right") -> str:
+        # Cached: object-array tables repeat the same short cells (enum
+        # values, booleans) across rows and refreshes.
         if width <= 0:
             return value
-        text = value
-        if len(text) > width:
-            if width <= 3:
-                text = text[:width]
-            else:
-                if side == "left":
-                    text = "..." + text[len(text) - (width - 3):]
-                else:
-                    text = text[: width - 3] + "..."
-        return text.ljust(width)
+        if len(value) <= width:
+            return value.ljust(width)
+        if width <= 3:
+            return value[:width]
+        if side == "left":
+            return "..." + value[len(value) - (width - 3):]
+        return value[: width - 3] + "..."
 
     @staticmethod
     def _trim_config(prop_spec: Dict[str, Any]) -> tuple[bool, str]:
@@ -550,16 +918,4 @@ class FieldFromSchema(Vertical):
 
     @staticmethod
     def _cast_value(raw: str, field_type: str) -> Any:
-        if field_type == "string":
-            return raw
-        if field_type == "integer":
-            return int(raw)
-        if field_type == "number":
-            return float(raw)
-        if field_type == "boolean":
-            if raw.lower() in ("true", "yes", "y", "1"):
-                return True
-            if raw.lower() in ("false", "no", "n", "0"):
-                return False
-            raise ValueError("Expected boolean (yes/no, true/false)")
-        raise ValueError(f"Unsupported type {field_type}")
+        return _caster_for(field_type)(raw)
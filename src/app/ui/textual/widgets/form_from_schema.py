@@ -63,21 +63,28 @@ class FormFromSchema(Vertical):
         self.render_form()
 
     def render_form(self) -> None:
-        self.remove_children()
+        """Mount one field per property.
+
+        The schema and initial values are fixed at construction, so once
+        the fields exist they are kept, with any edits made to them.
+        """
+        if self._fields:
+            return
+        fields: List[FieldFromSchema] = []
         for name, spec in self._properties.items():
             value = self._initial_values.get(name, spec.get("default"))
-            spec_copy = dict(spec)
             if name in self._required:
-                spec_copy["x-required"] = True
+                spec = {**spec, "x-required": True}
             field = FieldFromSchema(
                 name,
-                spec_copy,
+                spec,
                 initial_value=value,
                 mode="form",
                 object_array_mode="modal",
             )
             self._fields[name] = field
-            self.mount(field)
+            fields.append(field)
+        self.mount(*fields)
 
     def get_values(self) -> Dict[str, Any]:
         values: Dict[str, Any] = {}
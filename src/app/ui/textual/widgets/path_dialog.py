@@ -122,6 +122,7 @@ class PathDialog(ModalScreen[Optional[Path]]):
         self.sub_title = sub_title
         self.max_suggestions = max_suggestions
         self._path_field: PathField | None = None
+        self._error_static: Static | None = None
 
     def compose(self):
         """Build the dialog widget tree with input, autocomplete and buttons."""
@@ -138,13 +139,14 @@ class PathDialog(ModalScreen[Optional[Path]]):
             input_id="path_input",
             autocomplete_id="ac",
         )
+        self._error_static = Static("", id="error")
 
         yield Vertical(
             Static(str(self.title or ""), id="title"),
             Static(f"[i]{self.sub_title or ''}[/i]", id="subtitle"),
             self._path_field,
             Static(f"[i]Root: {self.root_dir}[/i]", id="root_label"),
-            Static("", id="error"),
+            self._error_static,
             Horizontal(
                 Button("Cancel", id="btn_cancel"),
                 Button("OK", variant="primary", id="btn_ok"),
@@ -232,7 +234,8 @@ class PathDialog(ModalScreen[Optional[Path]]):
 
     def _show_error(self, msg: str) -> None:
         """Display *msg* in the error label (red), or clear it when empty."""
-        self.query_one("#error", Static).update(f"[red]{msg}[/red]" if msg else "")
+        if self._error_static is not None:
+            self._error_static.update(f"[red]{msg}[/red]" if msg else "")
 
     def _to_absolute(self, relative: str) -> Path:
         """Convert a user-entered relative string to an absolute path.
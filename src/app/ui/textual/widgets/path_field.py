@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 from typing import List, Optional
 
+from textual import events
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import Input
@@ -15,7 +16,12 @@ from textual_autocomplete._autocomplete import TargetState
 
 
 class PathField(Vertical):
-    """Input field with filesystem autocomplete suggestions."""
+    """Input field with filesystem autocomplete suggestions.
+
+    The autocomplete overlay is only mounted once the input is first
+    focused, so forms with many path fields don't pay for dropdowns that
+    are never opened.
+    """
 
     def __init__(
         self,
@@ -45,6 +51,7 @@ class PathField(Vertical):
         self._input_id = input_id
         self._autocomplete_id = autocomplete_id
         self._input: Optional[Input] = None
+        self._autocomplete: Optional[AutoComplete] = None
 
     def compose(self) -> ComposeResult:
         initial = self._initial_value()
@@ -54,11 +61,16 @@ class PathField(Vertical):
             id=self._input_id,
         )
         yield self._input
-        yield AutoComplete(
+
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        if self._autocomplete is not None or self._input is None:
+            return
+        self._autocomplete = AutoComplete(
             target=self._input,
             candidates=self._candidates,
             id=self._autocomplete_id,
         )
+        self.mount(self._autocomplete)
 
     def focus_input(self) -> None:
         if self._input is not None:
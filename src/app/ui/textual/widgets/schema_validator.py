@@ -0,0 +1,51 @@
+"""Shared cache of compiled JSON-Schema validators.
+
+Validators are :class:`jsonschema.Draft202012Validator` instances: the
+config pages and wizard specs are Draft 2020-12 schemas, which code
+generating validators such as ``fastjsonschema`` (drafts 4, 6 and 7)
+cannot compile faithfully.  Speed comes instead from compiling each
+distinct schema once and sharing it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict
+
+from jsonschema import Draft202012Validator
+
+VALIDATOR_CACHE_SIZE = 256
+"""Maximum number of compiled validators kept across forms and dialogs."""
+
+_VALIDATOR_CACHE: "OrderedDict[bytes, Draft202012Validator]" = OrderedDict()
+
+
+def _schema_key(schema: Dict[str, Any]) -> bytes:
+    """Return a fixed-size digest of *schema*'s canonical JSON text."""
+    text = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def get_validator(schema: Dict[str, Any]) -> Draft202012Validator:
+    """Return a compiled validator for *schema*, shared by equal schemas.
+
+    Schemas are keyed by a digest of their canonical JSON text so that
+    reopening a dialog, or two forms built from the same spec, reuse one
+    validator even when providers rebuild the schema dicts.
+    Schemas are not checked against the meta-schema here: field specs
+    never were, and callers that validate whole documents check their
+    schema themselves.  The least recently used validators are evicted
+    beyond :data:`VALIDATOR_CACHE_SIZE`.
+    """
+    key = _schema_key(schema)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is not None:
+        _VALIDATOR_CACHE.move_to_end(key)
+        return validator
+    validator = Draft202012Validator(schema)
+    _VALIDATOR_CACHE[key] = validator
+    if len(_VALIDATOR_CACHE) > VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.popitem(last=False)
+    return validator
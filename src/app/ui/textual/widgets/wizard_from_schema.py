@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from copy import deepcopy
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
-from jsonschema import Draft202012Validator, validate, ValidationError
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -12,6 +15,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Static
 
 from .field_from_schema import FieldFromSchema
+from .schema_validator import get_validator
 
 
 # FIXME: add hasChanges to know if the user make changes
@@ -77,39 +81,49 @@ class WizardFromSchema(ModalScreen[Optional[Dict[str, Any]]]):
         self.properties = schema.get("properties", {})
         self.required = set(schema.get("required", []))
         self.field_order = list(self.properties.keys())
+        self._field_pos = {name: i for i, name in enumerate(self.field_order)}
 
         self.index = 0
         self._initial_values: Dict[str, Any] = dict(initial_values or {})
         self.data: Dict[str, Any] = dict(self._initial_values)
         self.current_field: Optional[FieldFromSchema] = None
+        # Field widget of every visited step: step index -> field
+        self._step_fields: Dict[int, FieldFromSchema] = {}
+        # Compiled validators, built on first use: step index -> validator
+        self._step_validators: Dict[int, Draft202012Validator] = {}
+        self._validator: Optional[Draft202012Validator] = None
+        # Data last rejected by the full schema, with the error shown for it.
+        self._rejected: Optional[Tuple[Dict[str, Any], str]] = None
 
     def compose(self) -> ComposeResult:
+        # Kept as attributes so each step does not query the DOM for them.
+        self._field_container = Vertical(id="field")
+        self._errors_static = Static("", id="errors")
+        self._back_button = Button("Cancel", id="back", variant="error")
+        self._next_button = Button("Next →", id="next", variant="primary")
         with Vertical(id="dialog"):
             yield Static("Formulario", id="title")
-            yield Vertical(id="field")
-            yield Static("", id="errors")
+            yield self._field_container
+            yield self._errors_static
             with Horizontal():
-                yield Button("Cancel", id="back", variant="error")
-                yield Button("Next →", id="next", variant="primary")
+                yield self._back_button
+                yield self._next_button
 
     def on_mount(self) -> None:
         self._render_field()
         self.call_after_refresh(self._focus_current)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        match event.button.id:
-            case "back":
-                self.action_back_or_cancel()
-            case "next":
-                self._submit_current()
+        button = event.button
+        if button is self._back_button:
+            self.action_back_or_cancel()
+        elif button is self._next_button:
+            self._submit_current()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        if event.input.id == "array-input":
-            if event.input.value.strip():
-                return
-            self._submit_current()
-        else:
-            self._submit_current()
+        # Array fields stop the Enter that adds an item; any other submit,
+        # an empty array input included, moves to the next step.
+        self._submit_current()
 
     def on_key(self, event) -> None:
         if event.key == "enter":
@@ -139,27 +153,33 @@ class WizardFromSchema(ModalScreen[Optional[Dict[str, Any]]]):
             self._go_back()
 
     def _render_field(self):
-        container = self.query_one("#field", Vertical)
-        container.remove_children()
-        self.query_one("#errors", Static).update("")
-
-        field = self.field_order[self.index]
-        spec = dict(self.properties[field])
-        if field in self.required:
-            spec["x-required"] = True
-        value = self._get_initial_value(field)
-
-        self.current_field = FieldFromSchema(
-            field,
-            spec,
-            initial_value=value,
-            mode="wizard",
-            object_array_mode="modal",
-        )
-        container.mount(self.current_field)
+        self._errors_static.update("")
+        if self.current_field is not None:
+            self.current_field.display = False
+
+        # Steps already visited are shown again as the user left them,
+        # rather than being torn down and mounted anew.
+        step = self._step_fields.get(self.index)
+        if step is None:
+            field = self.field_order[self.index]
+            spec = self.properties[field]
+            if field in self.required:
+                spec = {**spec, "x-required": True}
+            step = FieldFromSchema(
+                field,
+                spec,
+                initial_value=self._get_initial_value(field),
+                mode="wizard",
+                object_array_mode="modal",
+            )
+            self._step_fields[self.index] = step
+            self._field_container.mount(step)
+        else:
+            step.display = True
+        self.current_field = step
         self.call_after_refresh(self._focus_current)
 
-        back_btn = self.query_one("#back", Button)
+        back_btn = self._back_button
         if self.index == 0:
             back_btn.label = "Cancel"
             back_btn.variant = "error"
@@ -167,7 +187,7 @@ class WizardFromSchema(ModalScreen[Optional[Dict[str, Any]]]):
             back_btn.label = "← Back"
             back_btn.variant = "error"
 
-        next_btn = self.query_one("#next", Button)
+        next_btn = self._next_button
         if self.index >= len(self.field_order) - 1:
             next_btn.label = "Ok"
         else:
@@ -184,48 +204,76 @@ class WizardFromSchema(ModalScreen[Optional[Dict[str, Any]]]):
         if value is None and field not in self.required:
             self.index += 1
             if self.index >= len(self.field_order):
-                try:
-                    validate(self.data, self.schema)
-                except ValidationError as e:
-                    self.query_one("#errors", Static).update(str(e.message))
-                    self.index -= 1
-                    return
-                self.dismiss(self.data)
+                self._finish()
                 return
             self._render_field()
             return
 
         errors = self._validate_field_incremental(field, value)
         if errors:
-            self.query_one("#errors", Static).update("\n".join(f"❌ {e}" for e in errors))
+            self._errors_static.update("\n".join(f"❌ {e}" for e in errors))
             return
 
         self.data[field] = value
         self.index += 1
 
         if self.index >= len(self.field_order):
-            try:
-                validate(self.data, self.schema)
-            except ValidationError as e:
-                self.query_one("#errors", Static).update(str(e.message))
-                self.index -= 1
-                return
-            self.dismiss(self.data)
+            self._finish()
             return
 
         self._render_field()
 
+    def _finish(self) -> None:
+        """Check the whole form and dismiss with it, or stay on the last step.
+
+        A rejection is remembered with a snapshot of the data it was given,
+        so pressing Ok again without edits repeats the message instead of
+        traversing the full schema once more.
+        """
+        data = self.data
+        rejected = self._rejected
+        if rejected is not None and rejected[0] == data:
+            message = rejected[1]
+        else:
+            error = best_match(self._schema_validator().iter_errors(data))
+            if error is None:
+                self.dismiss(data)
+                return
+            message = str(error.message)
+            self._rejected = (deepcopy(data), message)
+        self._errors_static.update(message)
+        self.index -= 1
+
     def _focus_current(self) -> None:
         if self.current_field is None:
             return
         self.current_field.focus_first()
 
     def _validate_field_incremental(self, field_name: str, candidate_value: Any) -> List[str]:
-        idx = self.field_order.index(field_name)
-        visible = set(self.field_order[: idx + 1])
+        instance = dict(self.data)
+        instance[field_name] = candidate_value
 
-        props = {k: v for k, v in self.properties.items() if k in visible}
-        req = [k for k in self.required if k in visible]
+        v = self._step_validator(self._field_pos[field_name])
+        if v.is_valid(instance):
+            return []
+        return [e.message for e in v.iter_errors(instance)]
+
+    def _schema_validator(self) -> Draft202012Validator:
+        if self._validator is None:
+            # The whole schema is meta-checked, as jsonschema.validate did.
+            Draft202012Validator.check_schema(self.schema)
+            self._validator = get_validator(self.schema)
+        return self._validator
+
+    def _step_validator(self, idx: int) -> Draft202012Validator:
+        """Return the validator for the fields up to *idx*, compiled once."""
+        validator = self._step_validators.get(idx)
+        if validator is not None:
+            return validator
+        # field_order follows the properties, so the visible fields are
+        # exactly its first idx + 1 entries.
+        props = dict(islice(self.properties.items(), idx + 1))
+        req = [k for k in props if k in self.required]
 
         subschema = {
             "type": "object",
@@ -237,8 +285,6 @@ class WizardFromSchema(ModalScreen[Optional[Dict[str, Any]]]):
             if kw in self.schema:
                 subschema[kw] = self.schema[kw]
 
-        instance = dict(self.data)
-        instance[field_name] = candidate_value
-
-        v = Draft202012Validator(subschema)
-        return [e.message for e in v.iter_errors(instance)]
+        validator = get_validator(subschema)
+        self._step_validators[idx] = validator
+        return validator
@@ -40,6 +40,8 @@ class TestCastValue:
     def test_unsupported_type(self):
         with pytest.raises(ValueError, match="Unsupported"):
             self.renderer._cast_value("x", "object")
+        with pytest.raises(ValueError, match="Unsupported"):
+            self.renderer._cast_value("x", ["string", "null"])
 
 
 class TestValidateFieldIncremental:
@@ -71,6 +73,40 @@ class TestValidateFieldIncremental:
         )
         assert len(errors) > 0
 
+    def test_step_validators_built_once_per_schema(self):
+        r = ConsoleFormRenderer()
+        r.schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+        r.field_order = ["count"]
+        r._validate_field_incremental(field_name="count", candidate_value=1, partial_data={})
+        validator = r._step_validators[0]
+        r._validate_field_incremental(field_name="count", candidate_value=2, partial_data={})
+        assert r._step_validators[0] is validator
+
+        r.schema = {"type": "object", "properties": {"count": {"type": "string"}}}
+        errors = r._validate_field_incremental(
+            field_name="count", candidate_value=1, partial_data={}
+        )
+        assert errors == ["1 is not of type 'string'"]
+
+    def test_step_schema_covers_only_the_visible_prefix(self):
+        r = ConsoleFormRenderer()
+        r.schema = {
+            "type": "object",
+            "properties": {"a": {}, "b": {}, "c": {}},
+            "required": ["c", "a"],
+        }
+        r.field_order = ["a", "b", "c"]
+        step = r._step_validator(1).schema
+        assert list(step["properties"]) == ["a", "b"]
+        assert step["required"] == ["a"]
+
+    def test_field_positions_follow_field_order(self):
+        r = ConsoleFormRenderer()
+        r.field_order = ["a", "b"]
+        assert r._field_index("b") == 1
+        r.field_order = ["b", "a"]
+        assert r._field_index("b") == 0
+
 
 class TestAskForm:
     def test_rejects_non_object_schema(self):
@@ -89,6 +125,20 @@ class TestAskForm:
             result = r.ask_form(schema)
         assert result == {"name": "Alice"}
 
+    def test_repeated_form_reuses_its_validators(self):
+        r = ConsoleFormRenderer()
+        schema = {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"],
+        }
+        with patch.object(r, "_prompt", return_value="Alice"):
+            r.ask_form(schema)
+            full, step = r._form_validator, r._step_validators[0]
+            assert r.ask_form(schema) == {"name": "Alice"}
+        assert r._form_validator is full
+        assert r._step_validators[0] is step
+
     def test_cancel_on_first_field(self):
         r = ConsoleFormRenderer()
         schema = {
@@ -112,6 +162,16 @@ class TestAskForm:
         assert result is None
 
 
+class TestAskArray:
+    def test_unique_items_rejects_repeats(self):
+        r = ConsoleFormRenderer()
+        spec = {"type": "array", "items": {"type": "integer"}, "uniqueItems": True}
+        r.schema = {"type": "object", "properties": {"ids": spec}}
+        r.field_order = ["ids"]
+        with patch.object(r, "_prompt", side_effect=["1", "2", "1", "3", ""]):
+            assert r._ask_array("ids", spec, False, "ids", {}) == [1, 2, 3]
+
+
 class TestValidateArrayItem:
     def test_valid_item(self):
         r = ConsoleFormRenderer()
@@ -122,3 +182,12 @@ class TestValidateArrayItem:
         r = ConsoleFormRenderer()
         errors = r._validate_array_item("hello", {"type": "integer"})
         assert len(errors) > 0
+
+    def test_item_validator_reused_for_same_schema(self):
+        r = ConsoleFormRenderer()
+        items = {"type": "integer"}
+        assert not r._item_validators
+        r._validate_array_item(1, items)
+        validator = r._item_validators[id(items)][1]
+        assert r._validate_array_item("x", items) == ["'x' is not of type 'integer'"]
+        assert r._item_validators[id(items)][1] is validator
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 
-from app.context.session import Session
+from app.context.session import MessageKind, Session
 
 
 class TestSession:
@@ -24,3 +24,8 @@ class TestSession:
         s = Session()
         assert s.workspace is None
         assert s.project is None
+
+
+class TestMessageKind:
+    def test_uses_slots(self):
+        assert not hasattr(MessageKind("user", "hi"), "__dict__")
@@ -6,10 +6,10 @@ import pytest
 from typing import Any, Dict, cast
 
 from textual.app import App, ComposeResult
-from textual.widgets import Button, Input, ListView, Static
+from textual.widgets import Button, Input, ListView, RadioButton, Static
 
 from app.ui.textual.widgets.wizard_from_schema import WizardFromSchema
-from app.ui.textual.widgets.field_from_schema import FieldFromSchema
+from app.ui.textual.widgets.field_from_schema import FieldFromSchema, _field_ids
 
 
 # ----------------------------------------------------------------
@@ -94,6 +94,23 @@ def _default_schema():
     }
 
 
+def _trimmed_items_schema():
+    return {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "path": {"type": "string", "x-trim-side": "left"},
+        },
+    }
+
+
+def _name_path_items_schema():
+    return {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "path": {"type": "string"}},
+    }
+
+
 # ----------------------------------------------------------------
 # _cast_value — pure unit tests (no Textual runtime)
 # ----------------------------------------------------------------
@@ -132,6 +149,42 @@ class TestCastValue:
     def test_unsupported_type(self):
         with pytest.raises(ValueError, match="Unsupported"):
             FieldFromSchema._cast_value("x", "object")
+        with pytest.raises(ValueError, match="Unsupported"):
+            FieldFromSchema._cast_value("1", ["integer", "null"])
+
+    def test_caster_resolved_per_field(self):
+        assert FieldFromSchema("n", {"type": "integer"})._caster is int
+        array = FieldFromSchema("xs", {"type": "array", "items": {"type": "number"}})
+        assert array._caster is float
+
+    def test_array_flags_resolved_per_field(self):
+        spec = {"type": "array", "items": {"properties": {"a": {}}}, "uniqueItems": True}
+        field = FieldFromSchema("rows", spec)
+        assert field._object_items and field._unique_items
+        assert not FieldFromSchema("xs", {"type": "array"})._object_items
+
+
+# ----------------------------------------------------------------
+# _build_label
+# ----------------------------------------------------------------
+
+class TestBuildLabel:
+    def test_label_parts(self):
+        spec = {"description": "Your name", "default": "x"}
+        assert FieldFromSchema._build_label("name", spec, True) == (
+            "name — Your name [default: x] *"
+        )
+
+    def test_defaults_of_equal_value_keep_their_type(self):
+        assert FieldFromSchema._build_label("a", {"default": 1}, False) == "a [default: 1]"
+        assert FieldFromSchema._build_label("a", {"default": True}, False) == (
+            "a [default: True]"
+        )
+
+    def test_unhashable_default(self):
+        assert FieldFromSchema._build_label("a", {"default": ["x"]}, False) == (
+            "a [default: ['x']]"
+        )
 
 
 # ----------------------------------------------------------------
@@ -188,6 +241,21 @@ class TestValidateFieldIncremental:
         errors = fd._validate_field_incremental("count", 5)
         assert errors == []
 
+    def test_step_validator_compiled_once(self):
+        fd = WizardFromSchema(_integer_schema())
+        fd._validate_field_incremental("count", 0)
+        validator = fd._step_validators[0]
+        assert fd._validate_field_incremental("count", 5) == []
+        assert fd._step_validators[0] is validator
+
+    def test_step_sees_only_earlier_fields(self):
+        schema = _two_field_schema()
+        schema["required"] = ["first", "second"]
+        fd = WizardFromSchema(schema)
+        assert fd._validate_field_incremental("first", "a") == []
+        assert list(fd._step_validator(0).schema["properties"]) == ["first"]
+        assert fd._validate_field_incremental("second", None) != []
+
     def test_cross_field_allof(self):
         schema = {
             "type": "object",
@@ -241,6 +309,111 @@ class TestIsFreeTextArray:
         spec = _array_schema()["properties"]["tags"]
         assert FieldFromSchema.is_free_text_array(spec) is True
 
+    def test_matches_field_kind(self):
+        spec = {"type": "array", "enum": [["a"], ["b"]]}
+        assert FieldFromSchema._field_kind(spec) == "radio"
+        assert FieldFromSchema.is_free_text_array(spec) is False
+
+
+# ----------------------------------------------------------------
+# _field_kind
+# ----------------------------------------------------------------
+
+class TestFieldKind:
+    def test_kinds(self):
+        kind = FieldFromSchema._field_kind
+        assert kind({"type": "string"}) == "input"
+        assert kind({"type": "integer"}) == "input"
+        assert kind({"type": "string", "format": "directory"}) == "path"
+        assert kind(_enum_schema()["properties"]["lang"]) == "radio"
+        assert kind({"oneOf": [{"const": 1}]}) == "radio"
+        assert kind({"type": "boolean"}) == "checkbox"
+        assert kind(_array_schema()["properties"]["tags"]) == "array"
+        assert kind({"type": "array", "items": {"enum": ["a"]}}) == "array-select"
+
+    def test_resolved_once(self):
+        field = FieldFromSchema("n", {"type": "integer", "x-required": True})
+        assert field._kind == "input"
+        assert field._type == "integer"
+        assert field._required is True
+
+    def test_plain_type_check(self):
+        check = FieldFromSchema._plain_type_check
+        assert check({"type": "string", "title": "T", "x-required": True}) == ("string",)
+        assert check({"type": ["integer", "null"]}) == ("integer", "null")
+        assert check({"type": "string", "minLength": 1}) == ()
+        assert check({"enum": ["a"]}) == ()
+
+    def test_spec_kept_by_reference(self):
+        spec = {"type": "string"}
+        assert FieldFromSchema("n", spec)._spec is spec
+
+    def test_relative_path_root_follows_cwd(self, tmp_path, monkeypatch):
+        spec = {"type": "string", "format": "directory", "x-root-dir": "data"}
+        monkeypatch.chdir(tmp_path)
+        assert FieldFromSchema("a", spec)._path_root(spec) == tmp_path / "data"
+        (tmp_path / "other").mkdir()
+        monkeypatch.chdir(tmp_path / "other")
+        root = FieldFromSchema("b", spec)._path_root(spec)
+        assert root == tmp_path / "other" / "data"
+
+    def test_widget_ids_derived_once(self):
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"])
+        assert field._header_id == "cfg-tags--header"
+        assert field._autocomplete_id == "cfg-tags--ac"
+        wizard = FieldFromSchema("tags", {"type": "string"}, mode="wizard")
+        assert wizard._header_id == "array-items--header"
+        assert _field_ids("tags", False) is _field_ids("tags", False)
+
+
+# ----------------------------------------------------------------
+# format_array_item
+# ----------------------------------------------------------------
+
+class TestFormatArrayItem:
+    def test_object_row(self):
+        items = _trimmed_items_schema()
+        widths = {"name": 4, "path": 6}
+        row = FieldFromSchema.format_array_item(
+            items, {"name": "n", "path": "/very/long"}, widths
+        )
+        assert row == "n    | ...ong"
+
+    def test_layout_matches_widths(self):
+        items = _trimmed_items_schema()
+        widths = {"name": 4, "path": 6}
+        layout = FieldFromSchema._row_layout(items, widths)
+        value = {"name": "abcdef", "path": "/p"}
+        assert FieldFromSchema.format_array_item(items, value, layout=layout) == (
+            FieldFromSchema.format_array_item(items, value, widths)
+        )
+
+    def test_row_formatter_matches_format_array_item(self):
+        items = _trimmed_items_schema()
+        spec = {"type": "array", "items": items}
+        rows = [{"name": "abcdefgh", "path": "/p/q/r/s"}, {"name": "n"}, "plain"]
+        field = FieldFromSchema("rows", spec, rows)
+        field._set_array_widths({"name": 5, "path": 6})
+        for row in rows:
+            assert field._format_row(row) == FieldFromSchema.format_array_item(
+                items, row, {"name": 5, "path": 6}
+            )
+        assert field._format_header() == FieldFromSchema.format_array_header(
+            items, {"name": 5, "path": 6}
+        )
+
+    def test_trim_pad(self):
+        pad = FieldFromSchema._trim_pad
+        assert pad("ab", 4) == "ab  "
+        assert pad("abcdef", 5) == "ab..."
+        assert pad("abcdef", 5, "left") == "...ef"
+        assert pad("abcdef", 2) == "ab"
+        assert pad("abc", 0) == "abc"
+
+    def test_scalar_and_empty_object(self):
+        assert FieldFromSchema.format_array_item({"type": "string"}, 3) == "3"
+        assert FieldFromSchema.format_array_item({"type": "object"}, {"a": 1}) == "{'a': 1}"
+
 
 # ----------------------------------------------------------------
 # Constructor state
@@ -274,3 +447,421 @@ class TestConstructor:
 # Async / Textual integration tests
 # ----------------------------------------------------------------
 
+
+class _FieldApp(App):
+    def __init__(self, field: FieldFromSchema):
+        super().__init__()
+        self.field = field
+
+    def compose(self) -> ComposeResult:
+        yield self.field
+
+
+class _WizardApp(App):
+    def __init__(self, wizard: WizardFromSchema):
+        super().__init__()
+        self.wizard = wizard
+
+    def on_mount(self) -> None:
+        self.push_screen(self.wizard)
+
+
+class TestWizardSteps:
+    @pytest.mark.asyncio
+    async def test_steps_update_buttons_and_errors(self):
+        """Each step relabels the buttons and reports errors in place."""
+        wizard = WizardFromSchema(_integer_schema())
+        app = _WizardApp(wizard)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert str(wizard._back_button.label) == "Cancel"
+            assert str(wizard._next_button.label) == "Ok"
+            wizard.query_one("#count", Input).value = "0"
+            wizard._submit_current()
+            await pilot.pause()
+            assert "minimum" in str(wizard._errors_static.content)
+
+    @pytest.mark.asyncio
+    async def test_back_shows_the_visited_step_again(self):
+        """Back re-shows the earlier step's widget with what was typed."""
+        wizard = WizardFromSchema(_two_field_schema())
+        app = _WizardApp(wizard)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            first = wizard.current_field
+            wizard.query_one("#first", Input).value = "typed"
+            wizard._submit_current()
+            await pilot.pause()
+            second = wizard.current_field
+            assert second is not first and not first.display
+
+            wizard.action_back_or_cancel()
+            await pilot.pause()
+            assert wizard.current_field is first and first.display
+            assert not second.display
+            assert first.get_value() == "typed"
+            assert "first" not in wizard.data
+
+            wizard._submit_current()
+            await pilot.pause()
+            assert wizard.current_field is second
+            assert wizard.data == {"first": "typed"}
+
+    @pytest.mark.asyncio
+    async def test_enter_in_array_input_adds_until_empty(self):
+        """Enter adds the typed item; Enter on an empty input submits."""
+        wizard = WizardFromSchema(_array_schema())
+        app = _WizardApp(wizard)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            field = wizard.current_field
+            assert app.focused is field._array_input
+            await pilot.press("a", "enter")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert field.get_value() == ["a"]
+            assert app.screen is wizard
+
+            await pilot.press("enter")
+            await pilot.pause()
+            assert app.screen is not wizard
+
+    @pytest.mark.asyncio
+    async def test_unchanged_rejection_skips_full_check(self):
+        """Pressing Ok again on rejected, unedited data reuses the error."""
+        schema = {**_integer_schema(), "additionalProperties": False}
+        wizard = WizardFromSchema(schema, {"extra": 1})
+        app = _WizardApp(wizard)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            wizard.query_one("#count", Input).value = "2"
+            wizard._submit_current()
+            await pilot.pause()
+            assert "extra" in str(wizard._errors_static.content)
+
+            validator = wizard._validator
+            wizard._validator = None
+            wizard._submit_current()
+            await pilot.pause()
+            assert wizard._validator is None
+            assert "extra" in str(wizard._errors_static.content)
+
+            wizard.data.pop("extra")
+            wizard._validator = validator
+            wizard._submit_current()
+            await pilot.pause()
+            assert app.screen is not wizard
+
+
+class TestFieldValidation:
+    @pytest.mark.asyncio
+    async def test_value_checked_against_spec(self):
+        """Fields validate their value directly and share equal-spec validators."""
+        spec = {"type": "integer", "minimum": 1}
+        field = FieldFromSchema("count", spec, 0)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert not field.is_valid()
+            assert field.get_errors() == ["0 is less than the minimum of 1"]
+            field._widget.value = "2"
+            assert field.is_valid()
+            assert field.get_errors() == []
+            other = FieldFromSchema("size", dict(spec))
+            assert other._field_validator() is field._field_validator()
+
+    @pytest.mark.asyncio
+    async def test_array_items_share_one_validator(self):
+        """The item validator is built on the first add and reused after it."""
+        spec = {"type": "array", "items": {"type": "integer", "minimum": 1}}
+        field = FieldFromSchema("ids", spec)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field._item_validator is None
+            field._array_input.value = "0"
+            assert await field.add_to_array() == "* 0 is less than the minimum of 1"
+            validator = field._item_validator
+            field._array_input.value = "2"
+            assert await field.add_to_array() is None
+            assert field._item_validator is validator
+            assert field.get_value() == [2]
+
+    @pytest.mark.asyncio
+    async def test_unique_items_tracked_in_a_set(self):
+        """uniqueItems rejects repeats, and removed values can be added again."""
+        spec = {"type": "array", "items": {"type": "string"}, "uniqueItems": True}
+        field = FieldFromSchema("tags", spec, ["a", "b", "a"])
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field._array_value_set == {"a", "b"}
+            field._array_input.value = "b"
+            assert await field.add_to_array() == "Duplicate value not allowed"
+            field.remove_array_items([0])
+            assert field._array_value_set == {"a", "b"}
+            field.remove_array_items([1])
+            field._array_input.value = "a"
+            assert await field.add_to_array() is None
+            assert field.get_value() == ["b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_type_only_spec_skips_validator(self):
+        """Type-only fields are checked without building a validator."""
+        field = FieldFromSchema("n", {"type": "integer", "description": "N"}, 3)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field.is_valid()
+            assert field._validator is None
+
+    def test_malformed_spec_reports_field_errors(self):
+        """A bad keyword value in a field spec is not meta-checked."""
+        spec = {"type": "string", "title": 5, "x-required": True}
+        field = FieldFromSchema("name", spec)
+        assert not field.is_valid()
+        assert field.get_errors() == ["None is not of type 'string'"]
+
+
+class TestArrayChunks:
+    @pytest.mark.asyncio
+    async def test_long_array_mounts_rows_on_demand(self):
+        """Only the first chunk of rows is mounted until the list reaches it."""
+        values = [f"v{i}" for i in range(40)]
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"], values)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            list_view = app.query_one(ListView)
+            assert len(list_view.children) == FieldFromSchema.ARRAY_RENDER_CHUNK
+            assert field.get_value() == values
+
+            list_view.index = FieldFromSchema.ARRAY_RENDER_CHUNK - 1
+            await pilot.pause()
+            assert len(list_view.children) == 40
+
+    @pytest.mark.asyncio
+    async def test_arrow_keys_walk_the_list(self):
+        """Up enters the list from the end; down past the last row leaves it."""
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"], ["a", "b"])
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            list_view = app.query_one(ListView)
+            field.focus_first()
+            list_view.index = None
+            await pilot.press("up")
+            assert list_view.index == 1
+            await pilot.press("up", "up")
+            assert list_view.index == 0
+            await pilot.press("down", "down")
+            assert list_view.index is None
+            await pilot.press("x", "backspace")
+            assert field.get_value() == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_delete_keeps_rows_in_step(self):
+        """Each delete press drops the highlighted row and its label."""
+        values = ["a", "b", "c", "d", "e"]
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"], values)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            list_view = app.query_one(ListView)
+            field.focus_first()
+            list_view.index = 2
+            await pilot.press("delete", "delete")
+            await pilot.pause()
+            assert field.get_value() == ["a", "b", "e"]
+            assert [str(label.content) for label in field._item_labels] == ["a", "b", "e"]
+            assert len(list_view.children) == 3
+
+    @pytest.mark.asyncio
+    async def test_remove_many_rows_at_once(self):
+        """Rendered and pending rows can be removed in one batch."""
+        values = [f"v{i}" for i in range(40)]
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"], values)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            list_view = app.query_one(ListView)
+            field.remove_array_items([0, 2, 35])
+            await pilot.pause()
+            expected = [v for v in values if v not in ("v0", "v2", "v35")]
+            assert field.get_value() == expected
+            assert len(list_view.children) == FieldFromSchema.ARRAY_RENDER_CHUNK - 2
+            assert str(field._item_labels[0].content) == "v1"
+
+
+class TestObjectArrayWidths:
+    @pytest.mark.asyncio
+    async def test_rows_relaid_out_only_when_a_column_widens(self):
+        """Adding an item that fits leaves existing rows untouched."""
+        spec = {"type": "array", "items": _name_path_items_schema()}
+        field = FieldFromSchema("rows", spec, [{"name": "a", "path": "/p"}])
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            new_items = iter([{"name": "bb", "path": "/q"}, {"name": "longer", "path": "/q"}])
+
+            async def push_screen_wait(screen):
+                return next(new_items)
+
+            app.push_screen_wait = push_screen_wait
+            formatted = []
+            format_row = field._format_row
+            field._format_row = lambda v: formatted.append(v["name"]) or format_row(v)
+            await field.add_to_array()
+            assert formatted == ["bb"]
+            assert field._array_widths == {"name": 4, "path": 4}
+
+            formatted.clear()
+            await field.add_to_array()
+            assert formatted == ["longer", "a", "bb"]
+            assert field._array_widths == {"name": 6, "path": 4}
+            assert str(field._item_labels[0].content) == "a      | /p  "
+            assert str(field._item_labels[2].content) == "longer | /q  "
+
+    @pytest.mark.asyncio
+    async def test_columns_narrow_when_the_widest_row_is_removed(self):
+        """Removing the row that set a column's width re-fits the columns."""
+        spec = {"type": "array", "items": _name_path_items_schema()}
+        rows = [{"name": "a", "path": "/p"}, {"name": "longer", "path": "/q"}]
+        field = FieldFromSchema("rows", spec, rows)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field._array_widths == {"name": 6, "path": 4}
+            field.remove_array_items([1])
+            await pilot.pause()
+            assert field._array_widths == field._compute_widths(field._array_values)
+            assert field._array_widths == {"name": 4, "path": 4}
+            assert str(field._item_labels[0].content) == "a    | /p  "
+
+    @pytest.mark.asyncio
+    async def test_fixed_width_columns_skip_the_rescan(self):
+        """Removing a row never rescans columns whose width is fixed."""
+        items = {
+            "type": "object",
+            "properties": {"name": {"type": "string", "x-width": 3}},
+        }
+        rows = [{"name": "abc"}, {"name": "de"}]
+        field = FieldFromSchema("rows", {"type": "array", "items": items}, rows)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            measured = []
+            compute_widths = field._compute_widths
+            field._compute_widths = lambda values: measured.append(values) or (
+                compute_widths(values)
+            )
+            field.remove_array_items([0])
+            await pilot.pause()
+            assert measured == [[{"name": "abc"}]]
+            assert field._array_widths == {"name": 3}
+
+    def test_width_rules_are_resolved_once(self):
+        """Fixed columns keep their width and the rest fit the values."""
+        items = {
+            "type": "object",
+            "x-maxWidth": 5,
+            "x-column-widths": {"name": 3},
+            "properties": {
+                "name": {"type": "string"},
+                "path": {"type": "string", "x-width": 2},
+                "note": {"type": "string"},
+            },
+        }
+        field = FieldFromSchema("rows", {"type": "array", "items": items})
+        widths = field._compute_widths([{"name": "abcdef", "note": "a long note"}])
+        assert widths == {"name": 3, "path": 2, "note": 5}
+        assert list(widths) == ["name", "path", "note"]
+        rules = field._width_rules()
+        assert field._compute_widths([]) == {"name": 3, "path": 2, "note": 4}
+        assert field._width_rules() is rules
+
+
+class TestRadioValue:
+    @pytest.mark.asyncio
+    async def test_oneof_returns_declared_const(self):
+        """Radio values keep the const's type instead of its button-id text."""
+        spec = {"oneOf": [{"const": 1, "title": "One"}, {"const": True, "title": "Yes"}]}
+        field = FieldFromSchema("pick", spec, 1)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field.get_value() == 1
+            field.focus_first()
+            await pilot.pause()
+            assert app.focused is app.query_one("#cfg-pick")
+            app.query_one("#cfg-pick--1", RadioButton).value = True
+            await pilot.pause()
+            assert field.get_value() is True
+
+    @pytest.mark.asyncio
+    async def test_enum_values_need_not_be_identifiers(self):
+        spec = {"enum": ["a b", 1.5]}
+        field = FieldFromSchema("pick", spec, 1.5)
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field.get_value() == 1.5
+            app.query_one("#cfg-pick--0", RadioButton).value = True
+            await pilot.pause()
+            assert field.get_value() == "a b"
+
+    def test_choices_from_oneof_and_enum(self):
+        one_of = {"oneOf": [{"const": 1, "title": "One"}, {"const": 2}]}
+        assert FieldFromSchema._choices(one_of) == [
+            ("One", 1, "1"), ("2", 2, "2"),
+        ]
+        assert FieldFromSchema._choices({"enum": [2, "x"]}) == [
+            ("2", 2, "2"), ("x", "x", "x"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_multi_select_starts_with_initial_selection(self):
+        spec = {"type": "array", "items": {"oneOf": [{"const": "a"}, {"const": "b"}]}}
+        field = FieldFromSchema("pick", spec, ["b"])
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field.get_value() == ["b"]
+
+
+class TestArrayInput:
+    @pytest.mark.asyncio
+    async def test_children_mounted_in_one_call(self, monkeypatch):
+        """Label, list and input row are mounted together."""
+        calls = []
+        mount = FieldFromSchema.mount
+
+        def counting_mount(self, *widgets, **kwargs):
+            calls.append(len(widgets))
+            return mount(self, *widgets, **kwargs)
+
+        monkeypatch.setattr(FieldFromSchema, "mount", counting_mount)
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"], ["a"])
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert calls == [3]
+
+    @pytest.mark.asyncio
+    async def test_enter_and_add_button_append_items(self):
+        """The field's own input and Add button both append to the array."""
+        field = FieldFromSchema("tags", _array_schema()["properties"]["tags"])
+        app = _FieldApp(field)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            field.focus_first()
+            await pilot.pause()
+            assert app.focused is app.query_one("#cfg-tags--input", Input)
+            await pilot.press("a", "enter")
+            await app.workers.wait_for_complete()
+            await pilot.press("b")
+            app.query_one("#cfg-tags--add", Button).press()
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert field.get_value() == ["a", "b"]
@@ -140,21 +140,37 @@ def _make_provider(page_id: str, field: str, value=None) -> StubProvider:
 class TestAppConfigDialog:
     @pytest.mark.asyncio
     async def test_accept_calls_save_config(self):
-        """Accept triggers save_config on every provider."""
+        """Accept triggers save_config on providers whose values changed."""
         p1 = _make_provider("general", "name", "test")
         p2 = _make_provider("display", "theme", "dark")
         app = ProviderApp([p1, p2])
         async with app.run_test() as pilot:
             await pilot.pause()
+            await pilot.click("#cfg-name")
+            await pilot.press("end", "x")
             await pilot.click("#accept")
             await pilot.pause()
 
         assert len(p1.saved) == 1
-        assert len(p2.saved) == 1
-        # Both receive the same full dict
-        assert "general" in p1.saved[0]
+        assert len(p2.saved) == 0
+        # The changed provider receives the full dict
+        assert p1.saved[0]["general"].values["name"] == "testx"
         assert "display" in p1.saved[0]
-        assert p1.saved[0] == p2.saved[0]
+
+    @pytest.mark.asyncio
+    async def test_accept_skips_unchanged_providers(self):
+        """Accept without edits does not call save_config."""
+        p1 = _make_provider("general", "name", "test")
+        p2 = _make_provider("display", "theme", "dark")
+        app = ProviderApp([p1, p2])
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.click("#accept")
+            await pilot.pause()
+
+        assert ProviderApp.RESULT is not None
+        assert len(p1.saved) == 0
+        assert len(p2.saved) == 0
 
     @pytest.mark.asyncio
     async def test_apply_calls_save_config(self):
@@ -163,6 +179,8 @@ class TestAppConfigDialog:
         app = ApplyProviderApp([p])
         async with app.run_test() as pilot:
             await pilot.pause()
+            await pilot.click("#cfg-name")
+            await pilot.press("end", "x")
             await pilot.click("#apply")
             await pilot.pause()
 
@@ -219,10 +237,10 @@ class TestAppConfigDialog:
         assert result["alpha"].values["a_field"] == "a_val"
         assert result["beta"].values["b_field"] == "b_val"
         assert result["gamma"].values["g_field"] == "g_val"
-        # Every provider was notified
-        assert len(p1.saved) == 1
-        assert len(p2.saved) == 1
-        assert len(p3.saved) == 1
+        # No provider changed, so none was notified
+        assert len(p1.saved) == 0
+        assert len(p2.saved) == 0
+        assert len(p3.saved) == 0
 
     @pytest.mark.asyncio
     async def test_apply_reloads_pages(self):
@@ -245,3 +263,81 @@ class TestAppConfigDialog:
 
             await pilot.click("#cancel")
             await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_apply_keeps_unchanged_form(self):
+        """Apply does not re-render a form whose page and values are unchanged."""
+        p = _make_provider("general", "name", "same")
+        app = ApplyProviderApp([p])
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            form_before = dialog._form
+
+            await pilot.click("#apply")
+            await pilot.pause()
+
+            assert dialog._form is form_before
+
+            await pilot.click("#cancel")
+            await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_apply_keeps_validators_of_unchanged_schemas(self):
+        """Reloaded pages with the same schema reuse their compiled validator."""
+        p1 = _make_provider("general", "name", "same")
+        p2 = _make_provider("display", "theme", "dark")
+        app = ApplyProviderApp([p1, p2])
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            dialog._validate_all()
+            general_validator = dialog._page_validators["general"]
+
+            p2._page = ConfigPage(
+                id="display",
+                title="Display",
+                schema={"type": "object", "properties": {"size": {"type": "integer"}}},
+            )
+            await pilot.click("#apply")
+            await pilot.pause()
+
+            assert dialog._page_validators["general"] is general_validator
+            assert "display" not in dialog._page_validators
+
+            await pilot.click("#cancel")
+            await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_apply_keeps_unchanged_hidden_forms(self):
+        """Hidden forms survive Apply unless their page or values changed."""
+        p1 = _make_provider("general", "name", "same")
+        p2 = _make_provider("display", "theme", "dark")
+        app = ApplyProviderApp([p1, p2])
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            tree = dialog._tree
+            tree.select_node(tree.root.children[1])
+            await pilot.pause()
+            display_form = dialog._form
+            tree.select_node(tree.root.children[0])
+            await pilot.pause()
+            general_form = dialog._form
+
+            await pilot.click("#apply")
+            await pilot.pause()
+
+            assert dialog._forms["display"] is display_form
+            assert dialog._form is general_form
+
+            p2._values = ConfigValues(values={"theme": "light"})
+            dialog.query_one("#apply", Button).press()
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+
+            assert "display" not in dialog._forms
+            assert dialog._form is general_form
+
+            await pilot.click("#cancel")
+            await pilot.pause()
@@ -69,3 +69,64 @@ class TestChatInput:
             await pilot.press("t", "e", "s", "t")
             await pilot.press("enter")
         assert ChatApp.SUBMITTED == "test"
+
+    @pytest.mark.asyncio
+    async def test_trigger_shows_provider_items(self):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("/", "w", "o")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            chat = app.query_one(ChatInput)
+            options = chat._autocomplete.option_list
+            assert options.option_count == 1
+            assert options.get_option_at_index(0).value.strip() == "workspace"
+
+    @pytest.mark.asyncio
+    async def test_completion_appends_space(self):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("/", "w", "o")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            await pilot.press("tab")
+            await pilot.pause()
+            chat = app.query_one(ChatInput)
+            assert chat._input.value == "/workspace "
+
+    @pytest.mark.asyncio
+    async def test_late_candidates_do_not_reopen_dismissed_dropdown(self):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("/", "w", "o")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            chat = app.query_one(ChatInput)
+            autocomplete = chat._autocomplete
+            assert autocomplete.display
+
+            await pilot.press("escape")
+            await pilot.pause()
+            assert not autocomplete.display
+            chat._publish_candidates(chat._items_key, list(chat._items))
+            await pilot.pause()
+            assert not autocomplete.display
+
+            await pilot.press("backspace")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert autocomplete.display
+
+    @pytest.mark.asyncio
+    async def test_superseded_candidates_are_dropped(self):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            chat = app.query_one(ChatInput)
+            chat._pending_key = ("/", "wo")
+            chat._publish_candidates(("/", "w"), [])
+            assert chat._items_key is None
+            assert chat._pending_key == ("/", "wo")
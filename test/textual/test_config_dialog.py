@@ -11,6 +11,7 @@ from app.ui.textual.widgets.config_dialog import (
     ConfigPage,
     ConfigValues,
 )
+from app.ui.textual.widgets.field_from_schema import FieldFromSchema
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────
@@ -178,6 +179,27 @@ class TestConfigDialog:
         assert ConfigApp.RESULT is not None
         assert ConfigApp.RESULT["general"].values["name"] == "hello"
 
+    @pytest.mark.asyncio
+    async def test_enum_selection_roundtrip(self):
+        """Initial and newly pressed radio options are returned on accept."""
+        initial = {
+            "general": ConfigValues(values={"name": "test"}),
+            "display": ConfigValues(values={"theme": "dark"}),
+        }
+        app = ConfigApp(_simple_pages(), initial=initial)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            tree = app.screen.query_one("#config-tree", Tree)
+            tree.select_node(tree.root.children[1])
+            await pilot.pause()
+            assert app.screen._form.get_values()["theme"] == "dark"
+            await pilot.click("#cfg-theme--0")
+            await pilot.pause()
+            await pilot.click("#accept")
+            await pilot.pause()
+
+        assert ConfigApp.RESULT["display"].values["theme"] == "light"
+
     @pytest.mark.asyncio
     async def test_tree_renders_pages(self):
         """Tree widget shows all top-level pages."""
@@ -193,6 +215,24 @@ class TestConfigDialog:
             await pilot.click("#cancel")
             await pilot.pause()
 
+    @pytest.mark.asyncio
+    async def test_root_page_without_children(self):
+        """A root page whose children are None mounts as a leaf."""
+        page = ConfigPage(
+            id="solo",
+            title="Solo",
+            schema={"type": "object", "properties": {"name": {"type": "string"}}},
+            children=None,
+        )
+        app = ConfigApp([page])
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            tree = app.screen.query_one("#config-tree", Tree)
+            assert [str(n.label) for n in tree.root.children] == ["Solo"]
+            assert not tree.root.children[0].children
+            await pilot.click("#cancel")
+            await pilot.pause()
+
     @pytest.mark.asyncio
     async def test_nested_tree(self):
         """Nested pages render as tree children."""
@@ -208,6 +248,27 @@ class TestConfigDialog:
             await pilot.click("#cancel")
             await pilot.pause()
 
+    @pytest.mark.asyncio
+    async def test_deep_tree_levels_load_on_expand(self):
+        """Grandchild nodes are only added once their parent is expanded."""
+        pages = _nested_pages()
+        pages[0].children[0].children = [
+            ConfigPage(id="leaf", title="Leaf", schema={}),
+        ]
+        app = ConfigApp(pages)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            tree = app.screen.query_one("#config-tree", Tree)
+            child_node = tree.root.children[0].children[0]
+            assert child_node.allow_expand
+            assert len(child_node.children) == 0
+
+            child_node.expand()
+            await pilot.pause()
+            assert [str(n.label) for n in child_node.children] == ["Leaf"]
+            await pilot.click("#cancel")
+            await pilot.pause()
+
     @pytest.mark.asyncio
     async def test_apply_posts_message_and_stays_open(self):
         """Apply posts Applied message without closing the dialog."""
@@ -260,3 +321,237 @@ class TestConfigDialog:
         assert root.values["enabled"] is True
         assert "child" in root.childs
         assert root.childs["child"].values["level"] == 42
+
+
+class TestValidation:
+    def test_clean_pages_reuse_previous_errors(self):
+        """Pages are only re-validated after their values change."""
+        dialog = ConfigDialog(_simple_pages())
+        errors = dialog._validate_all()
+        assert errors == ["General: 'name' is a required property"]
+        assert dialog._dirty_pages == set()
+
+        assert dialog._validate_all() == errors
+
+        dialog._page_values["general"] = {"name": "ok"}
+        dialog._dirty_pages.add("general")
+        assert dialog._validate_all() == []
+
+    def test_empty_pages_skip_validators_only_when_safe(self):
+        """Untouched pages build no validator unless {} could be rejected."""
+        pages = _simple_pages() + [
+            ConfigPage(id="strict", title="Strict", schema={"minProperties": 1}),
+        ]
+        dialog = ConfigDialog(pages)
+        errors = dialog._validate_all()
+        assert "display" not in dialog._page_validators
+        assert set(dialog._page_validators) == {"general", "strict"}
+        assert errors[-1].startswith("Strict:")
+
+    def test_only_dirty_and_failing_pages_are_visited(self):
+        """Valid clean pages are skipped; errors keep the page order."""
+        dialog = ConfigDialog(_simple_pages())
+        dialog._validate_all()
+        assert list(dialog._page_errors) == ["general"]
+
+        dialog._page_values["display"] = {"theme": 1}
+        dialog._dirty_pages.add("display")
+        errors = dialog._validate_all()
+        assert errors[0].startswith("General:")
+        assert errors[1].startswith("Display:")
+
+    @pytest.mark.asyncio
+    async def test_accept_shows_errors_once_per_frame(self):
+        """Error text set twice in a frame is written once, with the last value."""
+        app = ConfigApp(_simple_pages())
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            await pilot.click("#accept")
+            dialog._set_error("first")
+            dialog._set_error("* General: 'name' is a required property")
+            await pilot.pause()
+            assert str(dialog._errors_static.content) == (
+                "* General: 'name' is a required property"
+            )
+            assert dialog._pending_error is None
+            assert ConfigApp.RESULT == "_UNSET"
+            await pilot.click("#cancel")
+            await pilot.pause()
+
+    def test_errors_are_capped(self):
+        """Validation stops after MAX_ERRORS messages and keeps the rest dirty."""
+        pages = [
+            ConfigPage(
+                id=f"p{i}",
+                title=f"P{i}",
+                schema={"type": "object", "required": ["a", "b", "c"]},
+            )
+            for i in range(10)
+        ]
+        dialog = ConfigDialog(pages)
+        errors = dialog._validate_all()
+        assert len(errors) == ConfigDialog.MAX_ERRORS
+        assert errors[0] == "P0: 'a' is a required property"
+        assert "p9" in dialog._dirty_pages
+        assert "p0" not in dialog._dirty_pages
+
+
+class TestInitialValues:
+    def test_initial_values_are_not_copied_or_mutated(self):
+        """Page values share the caller's dicts until a page is edited."""
+        general = {"name": "n"}
+        dialog = ConfigDialog(
+            _simple_pages(),
+            initial_values={"general": ConfigValues(values=general)},
+        )
+        assert dialog._page_values["general"] is general
+
+        result = dialog._build_values()
+        result["general"].values["name"] = "changed"
+        assert general == {"name": "n"}
+
+
+class TestDataclasses:
+    def test_pages_and_values_use_slots(self):
+        assert not hasattr(ConfigPage(id="p", title="P", schema={}), "__dict__")
+        assert not hasattr(ConfigValues(), "__dict__")
+
+    def test_leaf_pages_share_empty_children(self):
+        a = ConfigPage(id="a", title="A", schema={})
+        b = ConfigPage(id="b", title="B", schema={})
+        assert a.children == () and a.children is b.children
+
+    def test_tuple_and_none_children(self):
+        leaf = ConfigPage(id="leaf", title="Leaf", schema={}, children=None)
+        root = ConfigPage(id="root", title="Root", schema={}, children=(leaf,))
+        dialog = ConfigDialog([root])
+        assert dialog._page_order == ["root", "leaf"]
+        assert list(dialog._build_values()["root"].childs) == ["leaf"]
+
+    def test_messages_use_slots(self):
+        assert not hasattr(ConfigDialog.Applied({}), "__dict__")
+        assert not hasattr(FieldFromSchema.ArrayChanged(None), "__dict__")
+
+
+class TestPageWalk:
+    def test_page_order_is_preorder(self):
+        """Pages are indexed parents first, keeping sibling order."""
+        pages = _nested_pages() + _simple_pages()
+        pages[0].children.append(
+            ConfigPage(id="grandchild", title="Grandchild", schema={}),
+        )
+        pages[0].children[0].children = [
+            ConfigPage(id="leaf", title="Leaf", schema={}),
+        ]
+        dialog = ConfigDialog(pages)
+        assert dialog._page_order == [
+            "root", "child", "leaf", "grandchild", "general", "display",
+        ]
+        assert dialog._parent_map["leaf"] == "child"
+
+        values = dialog._build_values()
+        assert list(values) == ["root", "general", "display"]
+        assert list(values["root"].childs) == ["child", "grandchild"]
+        assert list(values["root"].childs["child"].childs) == ["leaf"]
+
+    def test_built_values_do_not_share_store_dicts(self):
+        """Rebuilt values are copies, including those of empty pages."""
+        initial = {"general": ConfigValues(values={"name": "a"})}
+        dialog = ConfigDialog(_simple_pages(), initial)
+        first = dialog._build_values()
+        second = dialog._build_values()
+        assert first["general"].values == {"name": "a"}
+        assert first["general"].values is not dialog._page_values["general"]
+        first["display"].values["theme"] = "dark"
+        assert second["display"].values == {}
+
+
+class TestFormCache:
+    @pytest.mark.asyncio
+    async def test_revisited_page_reuses_form(self):
+        """Switching back to a page shows its existing form again."""
+        app = ConfigApp(_simple_pages())
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            tree = dialog.query_one("#config-tree", Tree)
+            general_form = dialog._form
+
+            tree.select_node(tree.root.children[1])
+            await pilot.pause()
+            assert dialog._form is not general_form
+            assert general_form.display is False
+
+            tree.select_node(tree.root.children[0])
+            await pilot.pause()
+            assert dialog._form is general_form
+            assert general_form.display is True
+            await pilot.click("#cancel")
+            await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_render_form_keeps_existing_fields(self):
+        """Rendering a form again keeps its fields and their edits."""
+        app = ConfigApp(_simple_pages())
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            form = app.screen._form
+            fields = dict(form._fields)
+            await pilot.click("#cfg-name")
+            await pilot.press("x")
+            form.render_form()
+            await pilot.pause()
+            assert form._fields == fields
+            assert form.get_values() == {"name": "x"}
+            await pilot.click("#cancel")
+            await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_unedited_revisit_is_not_saved(self):
+        """Leaving a revisited page without edits skips reading its form."""
+        app = ConfigApp(_simple_pages())
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            tree = dialog.query_one("#config-tree", Tree)
+            tree.select_node(tree.root.children[1])
+            await pilot.pause()
+            dialog._validate_all()
+            assert dialog._dirty_pages == set()
+
+            tree.select_node(tree.root.children[0])
+            await pilot.pause()
+            tree.select_node(tree.root.children[1])
+            await pilot.pause()
+            assert "general" not in dialog._dirty_pages
+
+            tree.select_node(tree.root.children[0])
+            await pilot.pause()
+            await pilot.click("#cfg-name")
+            await pilot.press("x")
+            tree.select_node(tree.root.children[1])
+            await pilot.pause()
+            assert "general" in dialog._dirty_pages
+            assert dialog._page_values["general"] == {"name": "x"}
+            await pilot.click("#cancel")
+            await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_accept_reads_edited_form_once(self):
+        """Accept reads the edited form for validation and reuses it."""
+        app = ConfigApp(_simple_pages())
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            form = dialog._form
+            reads = []
+            get_values = form.get_values
+            form.get_values = lambda: reads.append(1) or get_values()
+            await pilot.click("#cfg-name")
+            await pilot.press("x")
+            await pilot.click("#accept")
+            await pilot.pause()
+
+        assert len(reads) == 1
+        assert ConfigApp.RESULT["general"].values["name"] == "x"
@@ -8,6 +8,7 @@ from textual.app import App, ComposeResult
 from textual.widgets import Button, Input
 
 from app.ui.textual.widgets.path_dialog import PathDialog
+from app.ui.textual.widgets.path_field import PathField
 
 
 class PathApp(App):
@@ -63,6 +64,7 @@ class TestPathDialogValidation:
             await pilot.pause()
             # Dialog should still be open (error shown)
             assert PathApp.RESULT == "_UNSET"
+            assert "does not exist" in str(dialog._error_static.content)
             await pilot.press("escape")
 
     @pytest.mark.asyncio
@@ -89,3 +91,32 @@ class TestPathDialogValidation:
             inp = dialog.query_one("#path_input", Input)
             assert "init" in inp.value
             await pilot.press("escape")
+
+
+
+class TestPathFieldAutocomplete:
+    @pytest.mark.asyncio
+    async def test_autocomplete_mounted_on_first_focus(self, tmp_path):
+        field = PathField(root_dir=tmp_path)
+
+        class FieldApp(App):
+            def compose(self) -> ComposeResult:
+                yield Button("first", id="first")
+                yield field
+
+        app = FieldApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert field._autocomplete is None
+            assert not field.query("#ac")
+
+            field.focus_input()
+            await pilot.pause()
+            autocomplete = field._autocomplete
+            assert autocomplete is not None and autocomplete.is_mounted
+
+            app.query_one("#first", Button).focus()
+            field.focus_input()
+            await pilot.pause()
+            assert field._autocomplete is autocomplete
+            assert len(field.query("#ac")) == 1
@@ -0,0 +1,38 @@
+"""Tests for app.ui.textual.widgets.schema_validator."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from app.ui.textual.widgets import schema_validator
+from app.ui.textual.widgets.schema_validator import get_validator
+
+
+class TestGetValidator:
+    def test_equal_schemas_share_validator(self):
+        """Equal schemas, regardless of key order, reuse one validator."""
+        a = {"type": "object", "required": ["x"]}
+        b = {"required": ["x"], "type": "object"}
+        assert get_validator(a) is get_validator(b)
+
+    def test_cache_keys_are_fixed_size(self):
+        """Large schemas do not keep their JSON text alive as a key."""
+        big = {"enum": [f"value-{i}" for i in range(500)]}
+        get_validator(big)
+        assert all(len(key) == 16 for key in schema_validator._VALIDATOR_CACHE)
+
+    def test_schema_is_not_meta_checked(self):
+        """A spec with a malformed annotation still compiles and validates."""
+        validator = get_validator({"type": "string", "title": 5})
+        assert validator.is_valid("x")
+        assert not validator.is_valid(1)
+
+    def test_least_recently_used_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(schema_validator, "VALIDATOR_CACHE_SIZE", 2)
+        monkeypatch.setattr(schema_validator, "_VALIDATOR_CACHE", OrderedDict())
+        first = get_validator({"minimum": 1})
+        get_validator({"minimum": 2})
+        assert get_validator({"minimum": 1}) is first
+        get_validator({"minimum": 3})
+        assert len(schema_validator._VALIDATOR_CACHE) == 2
+        assert get_validator({"minimum": 1}) is first